@@ -6,4 +6,6 @@ __all__ = [
     "validator",
     "rag",
     "schema_lookup",
+    "bm25",
+    "jsonio",
 ]
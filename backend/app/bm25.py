@@ -0,0 +1,129 @@
+"""Compact BM25 index persisted as plain numpy arrays."""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+K1 = 1.5
+B = 0.75
+EPSILON = 0.25
+
+_ARRAY_FILES = ("indptr", "doc_ids", "tf", "doc_len", "idf")
+
+
+class FastBM25:
+    """Okapi BM25 backed by a term-major sparse matrix of term frequencies.
+
+    Scores match ``rank_bm25.BM25Okapi`` with its default parameters. Postings for term ``t``
+    live in ``doc_ids[indptr[t]:indptr[t + 1]]`` / ``tf[...]``, so loading is a memory map of a
+    few ``.npy`` files rather than unpickling a Python object graph.
+    """
+
+    def __init__(
+        self,
+        vocab: List[str],
+        indptr: np.ndarray,
+        doc_ids: np.ndarray,
+        tf: np.ndarray,
+        doc_len: np.ndarray,
+        idf: np.ndarray,
+        *,
+        k1: float = K1,
+        b: float = B,
+    ) -> None:
+        self.vocab: Dict[str, int] = {term: position for position, term in enumerate(vocab)}
+        self.indptr = indptr
+        self.doc_ids = doc_ids
+        self.tf = tf
+        self.doc_len = doc_len
+        self.idf = idf
+        self.k1 = k1
+        self.b = b
+        self.corpus_size = int(doc_len.shape[0])
+        avgdl = float(doc_len.sum()) / self.corpus_size if self.corpus_size else 0.0
+        # Per-document length normalisation is query independent, so compute it once.
+        self._norm = k1 * (1 - b + b * np.asarray(doc_len, dtype="float64") / (avgdl or 1.0))
+
+    @classmethod
+    def from_corpus(cls, corpus: Sequence[Sequence[str]], *, k1: float = K1, b: float = B) -> "FastBM25":
+        vocab: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        counts: List[int] = []
+        doc_len = np.zeros(len(corpus), dtype="int32")
+        for doc_id, document in enumerate(corpus):
+            doc_len[doc_id] = len(document)
+            for term, count in Counter(document).items():
+                term_ids.append(vocab.setdefault(term, len(vocab)))
+                doc_ids.append(doc_id)
+                counts.append(count)
+
+        term_array = np.asarray(term_ids, dtype="int64")
+        order = np.argsort(term_array, kind="stable")
+        doc_freq = np.bincount(term_array, minlength=len(vocab))
+        indptr = np.zeros(len(vocab) + 1, dtype="int64")
+        np.cumsum(doc_freq, out=indptr[1:])
+
+        corpus_size = len(corpus)
+        idf = np.log((corpus_size - doc_freq + 0.5) / (doc_freq + 0.5))
+        if idf.size:
+            # Same floor rank_bm25 applies to terms present in more than half the documents.
+            idf[idf < 0] = EPSILON * (float(idf.sum()) / idf.size)
+
+        return cls(
+            list(vocab),
+            indptr,
+            np.asarray(doc_ids, dtype="int32")[order],
+            np.asarray(counts, dtype="int32")[order],
+            doc_len,
+            idf,
+            k1=k1,
+            b=b,
+        )
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        scores = np.zeros(self.corpus_size, dtype="float64")
+        for token in query:
+            term = self.vocab.get(token)
+            if term is None:
+                continue
+            start, end = self.indptr[term], self.indptr[term + 1]
+            docs = self.doc_ids[start:end]
+            tf = self.tf[start:end].astype("float64")
+            scores[docs] += self.idf[term] * tf * (self.k1 + 1) / (tf + self._norm[docs])
+        return scores
+
+    def save(self, directory: Path) -> None:
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in _ARRAY_FILES:
+            np.save(directory / f"{name}.npy", getattr(self, name))
+        terms = sorted(self.vocab, key=self.vocab.__getitem__)
+        with (directory / "vocab.json").open("w", encoding="utf-8") as handle:
+            json.dump({"terms": terms, "k1": self.k1, "b": self.b}, handle, ensure_ascii=True)
+
+    @classmethod
+    def load(cls, directory: Path, *, mmap: bool = True) -> "FastBM25":
+        with (directory / "vocab.json").open("r", encoding="utf-8") as handle:
+            vocab_payload = json.load(handle)
+        mmap_mode = "r" if mmap else None
+        arrays = {name: np.load(directory / f"{name}.npy", mmap_mode=mmap_mode) for name in _ARRAY_FILES}
+        return cls(
+            vocab_payload["terms"],
+            k1=float(vocab_payload.get("k1", K1)),
+            b=float(vocab_payload.get("b", B)),
+            **arrays,
+        )
+
+    @staticmethod
+    def exists(directory: Path) -> bool:
+        return (directory / "vocab.json").exists() and all(
+            (directory / f"{name}.npy").exists() for name in _ARRAY_FILES
+        )
+
+
+__all__ = ["FastBM25"]
@@ -0,0 +1,89 @@
+"""JSON file output shared by the ingestion scripts."""
+
+from __future__ import annotations
+
+import json
+import re
+from pathlib import Path
+from typing import Any
+
+try:  # orjson is optional; the stdlib encoder produces the same bytes, only slower.
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+# ``json.dumps(ensure_ascii=True)`` escapes everything outside printable ASCII (DEL included).
+# orjson always emits UTF-8 and already escapes control characters, so only this range is left.
+_NON_ASCII_RE = re.compile("[\u007f-\U0010ffff]")
+
+
+_SCALAR_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def _orjson_compatible(payload: Any) -> bool:
+    """True when orjson encodes ``payload`` exactly as the stdlib would.
+
+    Only str/int/bool/None scalars inside dicts (with str keys), lists and tuples qualify. Floats are
+    excluded because orjson formats exponents differently (``1e16`` vs ``1e+16``) and writes NaN and
+    infinities as ``null``; anything else (dataclasses, datetimes, subclasses) is left to the stdlib,
+    which either encodes it the reference way or raises.
+    """
+
+    stack = [payload]
+    while stack:
+        value = stack.pop()
+        kind = type(value)
+        if kind in _SCALAR_TYPES:
+            continue
+        if kind is dict:
+            for key, item in value.items():
+                if type(key) is not str:
+                    return False
+                stack.append(item)
+        elif kind is list or kind is tuple:
+            stack.extend(value)
+        else:
+            return False
+    return True
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match.group())
+    if code > 0xFFFF:
+        code -= 0x10000
+        return "\\u{:04x}\\u{:04x}".format(0xD800 | (code >> 10), 0xDC00 | (code & 0x3FF))
+    return "\\u{:04x}".format(code)
+
+
+def dumps_indented(payload: Any) -> bytes:
+    """Byte-for-byte ``json.dumps(payload, indent=2, ensure_ascii=True)``, encoded as ASCII.
+
+    orjson is only used for payloads it encodes identically (see ``_orjson_compatible``).
+    """
+
+    if orjson is not None and _orjson_compatible(payload):
+        try:
+            text = orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass  # e.g. lone surrogates, which only the stdlib encoder accepts
+        else:
+            return _NON_ASCII_RE.sub(_escape_non_ascii, text).encode("ascii")
+    return json.dumps(payload, indent=2, ensure_ascii=True).encode("ascii")
+
+
+def dumps_line(payload: Any) -> bytes:
+    """Compact UTF-8 JSON for one line of a JSON Lines file (no trailing newline)."""
+
+    if orjson is not None and _orjson_compatible(payload):
+        try:
+            return orjson.dumps(payload)
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=True).encode("ascii")
+
+
+def write_json(path: Path, payload: Any) -> None:
+    path.write_bytes(dumps_indented(payload))
+
+
+__all__ = ["dumps_indented", "dumps_line", "write_json"]
@@ -32,6 +32,7 @@ app.add_middleware(
 @app.on_event("startup")
 def _startup() -> None:
     settings.ensure_directories()
+    rag.preload_indices()
     
     # Mount static files for production frontend serving
     frontend_dist = Path(__file__).parent.parent.parent / "frontend" / "out"
@@ -1,4 +0,0 @@
-# Import the full app from main.py
-from .main import app
-
-__all__ = ["app"]
\ No newline at end of file
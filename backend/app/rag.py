@@ -13,6 +13,7 @@ import numpy as np
 import httpx
 
 from . import settings
+from .bm25 import FastBM25
 from .settings import ensure_directories
 
 ensure_directories()
@@ -67,7 +68,14 @@ def _load_meta() -> Tuple[List[str], Dict[str, Dict[str, str]]]:
 
 
 @lru_cache(maxsize=1)
-def _load_bm25() -> Tuple[BM25Okapi | None, List[str]]:
+def _load_bm25() -> Tuple[FastBM25 | BM25Okapi | None, List[str]]:
+    sparse_dir = settings.INDEX_DIR / "bm25"
+    ids_path = sparse_dir / "chunk_ids.json"
+    if FastBM25.exists(sparse_dir) and ids_path.exists():
+        with ids_path.open("r", encoding="utf-8") as handle:
+            chunk_ids = json.load(handle)
+        return FastBM25.load(sparse_dir), list(chunk_ids)
+    # Legacy pickled BM25Okapi payloads.
     if BM25Okapi is None:
         return None, []
     bm25_path = settings.INDEX_DIR / "bm25.pkl"
@@ -97,12 +105,24 @@ def _load_faiss() -> Tuple[faiss.Index | None, List[str]]:
     ids_path = settings.INDEX_DIR / "faiss_ids.json"
     if not index_path.exists() or not ids_path.exists():
         return None, []
-    index = faiss.read_index(str(index_path))
+    try:
+        # Memory-map the vectors so the OS page cache serves them instead of a full read into RAM.
+        index = faiss.read_index(str(index_path), faiss.IO_FLAG_MMAP)
+    except RuntimeError:
+        index = faiss.read_index(str(index_path))
     with ids_path.open("r", encoding="utf-8") as handle:
         chunk_ids = json.load(handle)
     return index, list(chunk_ids)
 
 
+def preload_indices() -> None:
+    """Load retrieval indices eagerly so the first search does not pay the I/O cost."""
+
+    _load_meta()
+    _load_bm25()
+    _load_faiss()
+
+
 @lru_cache(maxsize=1)
 def _load_encoder() -> SentenceTransformer | None:
     if SentenceTransformer is None:
@@ -315,6 +335,7 @@ def synthesize_answer(query: str, chunks: List[Dict[str, str]]) -> Dict[str, Lis
 
 
 __all__ = [
+    "preload_indices",
     "hybrid_search",
     "synthesize_answer",
 ]
@@ -4,12 +4,22 @@ from __future__ import annotations
 
 import json
 import re
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from jsonschema import Draft202012Validator
+from referencing import Registry
 
 from . import settings
+from .validator_codegen import cached_validator
+
+ErrorIterator = Callable[[Any], Iterable[Any]]
+
+# jsonschema adds the draft meta-schemas to any explicit registry; an empty one means an unknown
+# $ref fails immediately instead of being retrieved over the network mid-request.
+_REGISTRY: Registry = Registry()
 
 
 class SchemaNotFoundError(FileNotFoundError):
@@ -29,14 +39,62 @@ def load_schema(currency: str, country: str) -> Dict[str, Any]:
         return json.load(handle)
 
 
+@dataclass(slots=True)
+class CompiledSchema:
+    """A corridor schema plus the lookups ``validate_payload`` needs on every request."""
+
+    raw: Dict[str, Any]
+    method_keys: Dict[str, str]
+    channel_keys: Dict[str, Dict[str, str]]
+    default_channels: Dict[str, Optional[str]]
+    validators: Dict[Tuple[Optional[str], Optional[str]], ErrorIterator] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, raw: Dict[str, Any]) -> "CompiledSchema":
+        methods = raw.get("payout_methods") or {}
+        method_keys = {key.lower(): key for key in methods}
+        channel_keys: Dict[str, Dict[str, str]] = {}
+        default_channels: Dict[str, Optional[str]] = {}
+        for key, block in methods.items():
+            channels = block.get("channels") or {}
+            channel_keys[key] = {name.lower(): name for name in channels}
+            default_channel = block.get("default_channel")
+            default_channels[key] = default_channel.lower() if isinstance(default_channel, str) else None
+        return cls(raw, method_keys, channel_keys, default_channels)
+
+
+@lru_cache(maxsize=256)
+def _compiled_schema(currency: str, country: str, mtime_ns: int) -> CompiledSchema:
+    return CompiledSchema.build(load_schema(currency, country))
+
+
+def load_compiled_schema(currency: str, country: str) -> CompiledSchema:
+    """Cached ``CompiledSchema`` for a corridor; re-read when the schema file changes on disk."""
+
+    path = schema_path(currency, country)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise SchemaNotFoundError(f"No schema found for {currency}/{country}: {path}") from None
+    return _compiled_schema(currency, country, mtime_ns)
+
+
+def _build_validator(target_schema: Any) -> ErrorIterator:
+    # Corridor schemas normally compile to a generated validator; anything else goes through jsonschema.
+    compiled = cached_validator(target_schema) if isinstance(target_schema, dict) else None
+    if compiled is not None:
+        return compiled
+    return Draft202012Validator(target_schema, registry=_REGISTRY).iter_errors
+
+
 def _select_method(
-    schema: Dict[str, Any],
+    compiled: CompiledSchema,
     method: Optional[str],
 ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
-    methods = schema.get("payout_methods")
+    methods = compiled.raw.get("payout_methods")
     if not methods:
         return None, None
-    lookup = {key.lower(): key for key in methods}
+    lookup = compiled.method_keys
     requested = (method or "").lower()
     if requested and requested in lookup:
         key = lookup[requested]
@@ -50,18 +108,23 @@ def _select_method(
     return first_key, methods[first_key]
 
 
-def _select_channel(method_block: Dict[str, Any], channel: Optional[str]) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+def _select_channel(
+    compiled: CompiledSchema,
+    method_key: str,
+    method_block: Dict[str, Any],
+    channel: Optional[str],
+) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
     channels = method_block.get("channels") or {}
     if not channels:
         return None, None
-    lookup = {key.lower(): key for key in channels}
+    lookup = compiled.channel_keys[method_key]
     requested = (channel or "").lower()
     if requested and requested in lookup:
         key = lookup[requested]
         return key, channels[key]
-    default_channel = method_block.get("default_channel")
-    if isinstance(default_channel, str) and default_channel.lower() in lookup:
-        key = lookup[default_channel.lower()]
+    default_channel = compiled.default_channels[method_key]
+    if default_channel is not None and default_channel in lookup:
+        key = lookup[default_channel]
         return key, channels[key]
     if "local" in lookup:
         key = lookup["local"]
@@ -83,7 +146,7 @@ def validate_payload(
     """Validate payload against corridor schema and return structured result."""
 
     try:
-        schema = load_schema(currency, country)
+        compiled_schema = load_compiled_schema(currency, country)
     except SchemaNotFoundError as exc:
         return {
             "valid": False,
@@ -95,13 +158,14 @@ def validate_payload(
             ],
         }
 
+    schema = compiled_schema.raw
     method_block: Optional[Dict[str, Any]] = None
     method_key: Optional[str] = None
     channel_schema: Optional[Dict[str, Any]] = None
     channel_key: Optional[str] = None
 
     if "payout_methods" in schema:
-        method_key, method_block = _select_method(schema, method)
+        method_key, method_block = _select_method(compiled_schema, method)
         if method_block is None:
             available = sorted(schema.get("payout_methods", {}).keys())
             return {
@@ -114,7 +178,7 @@ def validate_payload(
                 ],
             }
 
-        channel_key, channel_schema = _select_channel(method_block, channel)
+        channel_key, channel_schema = _select_channel(compiled_schema, method_key, method_block, channel)
         if channel_schema is None:
             available_channels = sorted((method_block.get("channels") or {}).keys())
             requested_channel = channel or method_block.get("default_channel") or ""
@@ -138,10 +202,18 @@ def validate_payload(
     if isinstance(target_schema, dict):
         properties = target_schema.get("properties") or {}
 
-    validator = Draft202012Validator(target_schema)
+    validator_key = (method_key, channel_key)
+    iter_errors = compiled_schema.validators.get(validator_key)
+    if iter_errors is None:
+        iter_errors = _build_validator(target_schema)
+        compiled_schema.validators[validator_key] = iter_errors
     errors: List[Dict[str, Any]] = []
-    for error in validator.iter_errors(payload):
-        path = ".".join(str(segment) for segment in error.absolute_path)
+    for error in iter_errors(payload):
+        segments = error.absolute_path
+        if len(segments) == 1 and isinstance(segments[0], str):
+            path = segments[0]
+        else:
+            path = ".".join(map(str, segments))
         detail: Dict[str, Any] = {
             "path": path,
             "message": error.message,
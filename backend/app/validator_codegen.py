@@ -0,0 +1,179 @@
+"""Compile simple corridor JSON Schemas into straight-line Python validators.
+
+Corridor schemas generated from the validation workbook only use ``type``, ``properties``,
+``required``, ``pattern``, length limits and string ``enum``s. For those schemas we emit a plain
+Python function (inlined ``isinstance`` checks, precompiled regexes) that reports the same errors,
+in the same order and with the same messages, as ``Draft202012Validator.iter_errors``. Schemas using
+any other validation keyword are left to jsonschema.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from jsonschema import Draft202012Validator
+
+
+class CompiledError(NamedTuple):
+    """Subset of ``jsonschema.ValidationError`` attributes consumed by ``validate_payload``."""
+
+    message: str
+    validator: str
+    absolute_path: Tuple[str, ...]
+    schema: Dict[str, Any]
+
+
+CompiledValidator = Callable[[Any], List[CompiledError]]
+
+# Keywords with no validation effect (annotations) are ignored, exactly as jsonschema does.
+_VALIDATION_KEYWORDS = frozenset(Draft202012Validator.VALIDATORS)
+_SUPPORTED_KEYWORDS = frozenset(
+    {"type", "properties", "required", "pattern", "minLength", "maxLength", "enum", "additionalProperties"}
+)
+_TYPE_CHECKS = {
+    "string": "isinstance({0}, str)",
+    "object": "isinstance({0}, dict)",
+    "array": "isinstance({0}, list)",
+    "boolean": "isinstance({0}, bool)",
+    "null": "{0} is None",
+    "number": "(isinstance({0}, (int, float)) and not isinstance({0}, bool))",
+    "integer": (
+        "((isinstance({0}, int) and not isinstance({0}, bool))"
+        " or (isinstance({0}, float) and {0}.is_integer()))"
+    ),
+}
+
+_CACHE: Dict[str, Optional[CompiledValidator]] = {}
+
+
+class _Unsupported(Exception):
+    pass
+
+
+class _Emitter:
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+        self.namespace: Dict[str, Any] = {"_Error": CompiledError}
+        self._counter = 0
+
+    def name(self, prefix: str) -> str:
+        self._counter += 1
+        return f"_{prefix}{self._counter}"
+
+    def const(self, prefix: str, value: Any) -> str:
+        name = self.name(prefix)
+        self.namespace[name] = value
+        return name
+
+    def emit(self, indent: int, line: str) -> None:
+        self.lines.append("    " * indent + line)
+
+    def error(self, indent: int, message: str, keyword: str, path: str, schema: str) -> None:
+        self.emit(indent, f"append(_Error({message}, {keyword!r}, {path}, {schema}))")
+
+    def node(self, schema: Any, var: str, path: Tuple[str, ...], indent: int) -> None:
+        if not isinstance(schema, dict):
+            raise _Unsupported("boolean schemas")
+        schema_name = self.const("S", schema)
+        path_name = self.const("P", path)
+        for keyword, value in schema.items():
+            if keyword not in _VALIDATION_KEYWORDS:
+                continue
+            if keyword not in _SUPPORTED_KEYWORDS:
+                raise _Unsupported(keyword)
+            if keyword == "type":
+                types = value if isinstance(value, list) else [value]
+                if not types or any(kind not in _TYPE_CHECKS for kind in types):
+                    raise _Unsupported(f"type {value!r}")
+                check = " or ".join(_TYPE_CHECKS[kind].format(var) for kind in types)
+                reprs = ", ".join(repr(kind) for kind in types)
+                self.emit(indent, f"if not ({check}):")
+                self.error(indent + 1, f'f"{{{var}!r}} is not of type " + {reprs!r}', "type", path_name, schema_name)
+            elif keyword == "properties":
+                if not isinstance(value, dict):
+                    raise _Unsupported("properties")
+                if not value:
+                    continue
+                self.emit(indent, f"if isinstance({var}, dict):")
+                for prop, subschema in value.items():
+                    child = self.name("v")
+                    self.emit(indent + 1, f"if {prop!r} in {var}:")
+                    self.emit(indent + 2, f"{child} = {var}[{prop!r}]")
+                    self.node(subschema, child, path + (prop,), indent + 2)
+            elif keyword == "required":
+                if not isinstance(value, list) or not all(isinstance(prop, str) for prop in value):
+                    raise _Unsupported("required")
+                if not value:
+                    continue
+                self.emit(indent, f"if isinstance({var}, dict):")
+                for prop in value:
+                    self.emit(indent + 1, f"if {prop!r} not in {var}:")
+                    self.error(indent + 2, repr(f"{prop!r} is a required property"), "required", path_name, schema_name)
+            elif keyword == "pattern":
+                if not isinstance(value, str):
+                    raise _Unsupported("pattern")
+                try:
+                    compiled = re.compile(value)
+                except re.error as exc:
+                    # jsonschema raises re.error while validating; keep that behaviour.
+                    raise _Unsupported("invalid pattern") from exc
+                search = self.const("R", compiled.search)
+                suffix = repr(f" does not match {value!r}")
+                self.emit(indent, f"if isinstance({var}, str) and not {search}({var}):")
+                self.error(indent + 1, f'f"{{{var}!r}}" + {suffix}', "pattern", path_name, schema_name)
+            elif keyword in ("minLength", "maxLength"):
+                if not isinstance(value, int) or isinstance(value, bool):
+                    raise _Unsupported(keyword)
+                if keyword == "minLength":
+                    comparison = f"len({var}) < {value}"
+                    text = "should be non-empty" if value == 1 else "is too short"
+                else:
+                    comparison = f"len({var}) > {value}"
+                    text = "is expected to be empty" if value == 0 else "is too long"
+                self.emit(indent, f"if isinstance({var}, str) and {comparison}:")
+                self.error(indent + 1, f'f"{{{var}!r}} {text}"', keyword, path_name, schema_name)
+            elif keyword == "enum":
+                if not isinstance(value, list) or not all(isinstance(choice, str) for choice in value):
+                    raise _Unsupported("non-string enum")
+                choices = self.const("C", frozenset(value))
+                suffix = repr(f" is not one of {value!r}")
+                self.emit(indent, f"if not (isinstance({var}, str) and {var} in {choices}):")
+                self.error(indent + 1, f'f"{{{var}!r}}" + {suffix}', "enum", path_name, schema_name)
+            elif keyword == "additionalProperties":
+                if value is not True:
+                    raise _Unsupported("additionalProperties")
+
+
+def compile_schema(schema: Dict[str, Any]) -> Optional[CompiledValidator]:
+    """Return a generated validator for ``schema`` or ``None`` when it needs jsonschema."""
+
+    emitter = _Emitter()
+    try:
+        emitter.node(schema, "instance", (), 1)
+    except _Unsupported:
+        return None
+    source = "\n".join(
+        ["def _validate(instance):", "    errors = []", "    append = errors.append", *emitter.lines, "    return errors"]
+    )
+    exec(compile(source, "<validator_codegen>", "exec"), emitter.namespace)
+    return emitter.namespace["_validate"]
+
+
+def cached_validator(schema: Dict[str, Any]) -> Optional[CompiledValidator]:
+    """``compile_schema`` memoised on the schema content (key order matters for error order)."""
+
+    digest = hashlib.sha1(json.dumps(schema, ensure_ascii=True).encode("ascii")).hexdigest()
+    if digest not in _CACHE:
+        _CACHE[digest] = compile_schema(schema)
+    return _CACHE[digest]
+
+
+__all__ = [
+    "CompiledError",
+    "CompiledValidator",
+    "compile_schema",
+    "cached_validator",
+]
@@ -1,9 +1,26 @@
-"""Entry-point to run the FastAPI app with Uvicorn."""
+"""Entry-point to run the FastAPI app with Uvicorn.
+
+Configured through the environment: ``BACKEND_HOST`` / ``BACKEND_PORT`` (the frontend expects
+``0.0.0.0:8000``), ``RELOAD=1`` for auto-reload during development and ``WORKERS`` for the number
+of worker processes.
+"""
 
 from __future__ import annotations
 
+import os
 import uvicorn
 
 
 if __name__ == "__main__":
-    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
+    # Set CORS origins for iframe widget support
+    os.environ.setdefault("CORS_ORIGINS", "*")
+    uvicorn.run(
+        "app.main:app",
+        host=os.environ.get("BACKEND_HOST", "0.0.0.0"),
+        port=int(os.environ.get("BACKEND_PORT", 8000)),
+        reload=os.environ.get("RELOAD") == "1",
+        workers=int(os.environ.get("WORKERS", 1)),
+        # "auto" picks uvloop/httptools when installed (uvicorn[standard]) and falls back otherwise.
+        loop=os.environ.get("UVICORN_LOOP", "auto"),
+        http=os.environ.get("UVICORN_HTTP", "auto"),
+    )
@@ -3,16 +3,17 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
-from collections import deque
-from dataclasses import dataclass
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Iterable, List, Set, Tuple, Sequence, cast
+from typing import Dict, Iterable, List, Set, Tuple, Sequence
 from urllib.parse import urljoin, urlparse
 
 import httpx
-from bs4 import BeautifulSoup
-from bs4.element import Tag
+import lxml.html
+from lxml import etree
 from markdownify import markdownify
 from readability import Document
 from tenacity import RetryError, retry, stop_after_attempt, wait_fixed
@@ -33,25 +34,38 @@ EXCLUDED_URLS = [
 ]
 
 MAX_DEPTH = 2
+# Upper bound on in-flight requests while a crawl level is fetched.
+CONCURRENCY = 16
 USER_AGENT = "Nium-Developer-Copilot/0.1"
 
+# Pages are fed to the parser as UTF-8 bytes so documents with an XML encoding declaration parse too.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+_SKIPPED_HREF_PREFIXES = ("mailto:", "#", "javascript:")
+# str.translate tables: spaces/underscores become hyphens, other non-alphanumeric ASCII is dropped.
+_SLUG_TABLE: Dict[int, str | None] = {
+    code: None for code in range(128) if not chr(code).isalnum() and chr(code) != "-"
+}
+_SLUG_TABLE.update({ord(" "): "-", ord("_"): "-"})
+_FRAGMENT_TABLE: Dict[int, str | None] = {code: None for code in range(128) if not chr(code).isalnum()}
 
-@dataclass
-class Page:
-    url: str
-    depth: int
+
+def _strip_to_alnum(text: str, table: Dict[int, str | None], keep: str = "") -> str:
+    cleaned = text.translate(table)
+    if cleaned.isascii():
+        return cleaned
+    # Non-ASCII characters are outside the tables; filter those with the (slower) unicode check.
+    return "".join(char for char in cleaned if char.isalnum() or char in keep)
 
 
 def slugify(url: str) -> str:
     parsed = urlparse(url)
     path = parsed.path.strip("/") or "index"
     safe = "-".join(part for part in path.split("/") if part)
-    safe = safe.replace(" ", "-").replace("_", "-")
-    safe = "".join(char for char in safe if char.isalnum() or char == "-")
+    safe = _strip_to_alnum(safe, _SLUG_TABLE, keep="-")
     if not safe:
         safe = "index"
     if parsed.fragment:
-        frag = "".join(char for char in parsed.fragment if char.isalnum())
+        frag = _strip_to_alnum(parsed.fragment, _FRAGMENT_TABLE)
         if frag:
             safe = f"{safe}-{frag}"
     return safe.lower()
@@ -62,23 +76,22 @@ def same_host(url: str, root: str) -> bool:
 
 
 def extract_links(html: str, base_url: str) -> Iterable[str]:
-    soup = BeautifulSoup(html, "lxml")
-    anchors: List[Tag] = cast(List[Tag], soup.select("a[href]"))
-    for a in anchors:
-        href = a.get("href")
-        if not isinstance(href, str):
-            continue
-        if href.startswith(("mailto:", "#", "javascript:")):
+    try:
+        root = lxml.html.document_fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+    except etree.ParserError:
+        return
+    for anchor in root.iterfind(".//a[@href]"):
+        href = anchor.get("href")
+        if not href or href.startswith(_SKIPPED_HREF_PREFIXES):
             continue
         yield urljoin(base_url, href)
 
 
 @retry(stop=stop_after_attempt(3), wait=wait_fixed(1))
-def fetch(url: str) -> httpx.Response:
-    with httpx.Client(timeout=httpx.Timeout(10.0), headers={"User-Agent": USER_AGENT}) as client:
-        response = client.get(url, follow_redirects=True)
-        response.raise_for_status()
-        return response
+async def fetch(client: httpx.AsyncClient, url: str) -> httpx.Response:
+    response = await client.get(url, follow_redirects=True)
+    response.raise_for_status()
+    return response
 
 
 def to_markdown(html: str) -> Tuple[str, str]:
@@ -98,54 +111,92 @@ def should_exclude_url(url: str) -> bool:
     return False
 
 
-def crawl(roots: Iterable[str], out_dir: Path) -> List[Dict[str, str]]:
+def write_page(out_dir: Path, url: str, title: str, markdown: str) -> Dict[str, str]:
+    slug = slugify(url)
+    path = out_dir / f"{slug}.md"
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(f"# {title}\n\n" if title else "")
+        handle.write(markdown)
+    return {"title": title or slug, "url": url, "slug": slug}
+
+
+async def crawl_async(
+    roots: Iterable[str],
+    out_dir: Path,
+    *,
+    concurrency: int = CONCURRENCY,
+) -> List[Dict[str, str]]:
     out_dir.mkdir(parents=True, exist_ok=True)
     metadata: List[Dict[str, str]] = []
     visited: Set[str] = set()
-    
+    roots = list(roots)
+
     # Pre-compute allowed hosts for domain-level filtering
     allowed_hosts = {urlparse(root).netloc for root in roots}
-    
-    queue: deque[Page] = deque(Page(url=root, depth=0) for root in roots)
-    while queue:
-        page = queue.popleft()
-        if page.url in visited:
-            continue
-        
-        # Skip excluded URLs
-        if should_exclude_url(page.url):
-            visited.add(page.url)  # Mark as visited to prevent re-queuing
-            continue
-            
-        visited.add(page.url)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_bounded(client: httpx.AsyncClient, url: str) -> httpx.Response:
+        async with semaphore:
+            return await fetch(client, url)
+
+    # Breadth-first: every page of a depth level is fetched concurrently before the next level starts.
+    level = list(dict.fromkeys(roots))
+    depth = 0
+    loop = asyncio.get_running_loop()
+    # readability + markdownify are CPU-bound pure Python, so convert pages on all cores.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0), headers={"User-Agent": USER_AGENT}) as client:
+            while level:
+                batch: List[str] = []
+                for url in level:
+                    if url in visited:
+                        continue
+                    # Excluded URLs are marked as visited to prevent re-queuing
+                    visited.add(url)
+                    if should_exclude_url(url):
+                        continue
+                    batch.append(url)
+
+                responses = await asyncio.gather(
+                    *(fetch_bounded(client, url) for url in batch),
+                    return_exceptions=True,
+                )
+
+                pages: List[Tuple[str, str]] = []
+                for url, response in zip(batch, responses):
+                    if isinstance(response, (httpx.HTTPError, RetryError)):
+                        continue
+                    if isinstance(response, BaseException):
+                        raise response
+                    pages.append((url, response.text))
+                conversions = await asyncio.gather(
+                    *(loop.run_in_executor(pool, to_markdown, html) for _, html in pages)
+                )
+
+                next_level: Dict[str, None] = {}
+                for (url, html), (title, markdown) in zip(pages, conversions):
+                    metadata.append(write_page(out_dir, url, title, markdown))
+
+                    if depth >= MAX_DEPTH:
+                        continue
+
+                    for link in extract_links(html, url):
+                        # Use domain-level filtering instead of restrictive path matching
+                        if urlparse(link).netloc not in allowed_hosts:
+                            continue
+                        if link in visited:
+                            continue
+                        # Skip excluded URLs when adding to queue
+                        if should_exclude_url(link):
+                            continue
+                        next_level.setdefault(link)
+                level = list(next_level)
+                depth += 1
+    return metadata
 
-        try:
-            response = fetch(page.url)
-        except (httpx.HTTPError, RetryError):
-            continue
-        html = response.text
-        title, markdown = to_markdown(html)
-        slug = slugify(page.url)
-        path = out_dir / f"{slug}.md"
-        with path.open("w", encoding="utf-8") as handle:
-            handle.write(f"# {title}\n\n" if title else "")
-            handle.write(markdown)
-        metadata.append({"title": title or slug, "url": page.url, "slug": slug})
-
-        if page.depth >= MAX_DEPTH:
-            continue
 
-        for link in extract_links(html, page.url):
-            # Use domain-level filtering instead of restrictive path matching
-            if urlparse(link).netloc not in allowed_hosts:
-                continue
-            if link in visited:
-                continue
-            # Skip excluded URLs when adding to queue
-            if should_exclude_url(link):
-                continue
-            queue.append(Page(url=link, depth=page.depth + 1))
-    return metadata
+def crawl(roots: Iterable[str], out_dir: Path) -> List[Dict[str, str]]:
+    return asyncio.run(crawl_async(roots, out_dir))
 
 
 def main(args: Sequence[str] | None = None) -> None:
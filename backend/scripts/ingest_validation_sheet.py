@@ -3,19 +3,31 @@
 from __future__ import annotations
 
 import argparse
-import json
+import os
 import re
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from itertools import groupby, repeat
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+import numpy as np
 import pandas as pd
 from openpyxl import load_workbook as openpyxl_load_workbook
 from openpyxl.cell import Cell
+from openpyxl.workbook.workbook import Workbook
 from openpyxl.worksheet.worksheet import Worksheet
 from tqdm import tqdm
 
 from app import settings
+from app.jsonio import dumps_line, write_json
+
+try:  # zstandard is optional; without it a bundle is written as plain JSON Lines.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on the environment
+    zstandard = None  # type: ignore[assignment]
 
 
 class DebugOptions:
@@ -54,6 +66,19 @@ class DebugOptions:
             return False
         return True
 
+    def as_filter(self) -> Dict[str, str]:
+        """The configured filters keyed by record column; empty when debugging is off."""
+
+        if not self.enabled:
+            return {}
+        values = {
+            "Country": self.country,
+            "Currency": self.currency,
+            "Method": self.method,
+            "Channel": self.channel,
+        }
+        return {column: value for column, value in values.items() if value}
+
 
 DEBUG = DebugOptions()
 
@@ -70,6 +95,10 @@ EXPECTED_COLUMN_ORDER = [
     "Notes",
 ]
 EXPECTED_COLUMNS = set(EXPECTED_COLUMN_ORDER)
+MATRIX_RECORD_COLUMNS = [*EXPECTED_COLUMN_ORDER, "Method", "Channel", "__mandatory_state__"]
+# Per-row details render_leaf_schema reads besides the precomputed constraints.
+FIELD_DETAIL_COLUMNS = ("Mandatory", "Conditional", "Notes", "__mandatory_state__")
+CATEGORICAL_RECORD_COLUMNS = ("Mandatory", "Method", "Channel", "__mandatory_state__")
 
 COUNTRY_CURRENCY_RE = re.compile(r"^(?P<country>.+?)\s*\((?P<currency>[A-Z0-9]{3})\)$")
 COUNTRY_CURRENCY_DESCRIPTOR_RE = re.compile(
@@ -108,6 +137,9 @@ MUST_MANDATORY_PHRASES = (
     "must quote",
     "must list",
 )
+_UNCLEAN_CHARS = frozenset("\u00a0\r\n\t")
+CONDITIONAL_PHRASE_RE = re.compile("|".join(map(re.escape, CONDITIONAL_PHRASES)))
+MUST_MANDATORY_PHRASE_RE = re.compile("|".join(map(re.escape, MUST_MANDATORY_PHRASES)))
 
 SHEET_METHOD_MAP = {
     "bank": "bank",
@@ -123,7 +155,16 @@ DEFAULT_CHANNEL_BY_METHOD = {
     "card": "default",
     "cash": "default",
 }
+# Order of channels within a payout method in the generated schemas; unknown channels sort by name
+# between the known ones and "default".
+CHANNEL_ORDER = {"local": 0, "wire": 1, "swift": 2, "default": 99}
 COLOR_STATE_MAP: Dict[str, str] = {}
+# Resolved states keyed by the raw colour attributes of a solid fill; a sheet only uses a handful.
+_FILL_STATE_CACHE: Dict[Tuple[Any, ...], str] = {}
+_COLOR_ATTRIBUTES = ("rgb", "theme", "tint", "indexed", "type", "value")
+# scan_worksheet stores cell colour states as small integer codes; code 0 (no solid fill) is optional.
+FILL_STATES = ("optional", "mandatory", "conditional")
+_FILL_STATE_CODES = {state: code for code, state in enumerate(FILL_STATES)}
 WIRE_HINTS = {
     "wire",
     "swift",
@@ -146,9 +187,24 @@ LOCAL_HINTS = {
     "in-country",
     "incountry",
 }
+# Every channel discriminator in one pattern. Each alternative sits in a lookahead so ``finditer``
+# reports all of them, including overlapping ones; ``channel_hint`` then applies their precedence.
+CHANNEL_HINT_RE = re.compile(
+    "|".join(
+        [
+            "(?=(?P<wire>{}))".format("|".join(map(re.escape, sorted(WIRE_HINTS)))),
+            "(?=(?P<local>{}))".format("|".join(map(re.escape, sorted(LOCAL_HINTS)))),
+            r"(?=(?P<wire_key>regex\(wires|description\.[13]))",
+            r"(?=(?P<local_key>regex\(local))",
+        ]
+    )
+)
 
 
 def clean_text(value: Any) -> str:
+    # Fast path: most headers and cell values are already single-line and stripped.
+    if isinstance(value, str) and _UNCLEAN_CHARS.isdisjoint(value) and value == value.strip():
+        return "" if value.lower() == "nan" else value
     if value is None or (isinstance(value, float) and pd.isna(value)):
         return ""
     if isinstance(value, str):
@@ -167,6 +223,21 @@ def clean_text(value: Any) -> str:
     return normalized
 
 
+def clean_series(series: pd.Series) -> pd.Series:
+    """Vectorised ``clean_text`` for a whole column; produces the same strings element-wise."""
+
+    text = (
+        series.fillna("")
+        .astype(str)
+        .str.replace("\u00a0", " ", regex=False)
+        .str.replace("\r\n", " ", regex=False)
+        .str.replace("\n", " ", regex=False)
+        .str.replace("\t", " ", regex=False)
+        .str.strip()
+    )
+    return text.mask(text.str.lower() == "nan", "")
+
+
 def infer_method(sheet_name: str) -> Optional[str]:
     name = clean_text(sheet_name).lower()
     if not name:
@@ -181,8 +252,9 @@ def infer_method(sheet_name: str) -> Optional[str]:
 
 def build_color_state_map(workbook_path: Path) -> None:
     COLOR_STATE_MAP.clear()
+    _FILL_STATE_CACHE.clear()
     try:
-        wb = openpyxl_load_workbook(workbook_path, data_only=False)
+        wb = openpyxl_load_workbook(workbook_path, read_only=True, data_only=True, keep_links=False)
     except ValueError:
         return
     instructions_sheet: Optional[Worksheet] = None
@@ -194,16 +266,19 @@ def build_color_state_map(workbook_path: Path) -> None:
         wb.close()
         return
 
-    for row in (2, 3, 4):
-        color_cell = instructions_sheet.cell(row=row, column=2)
-        label_cell = instructions_sheet.cell(row=row, column=3)
+    # The legend sits in B2:C4 (colour swatch, label); read it in one streamed pass.
+    for color_cell, label_cell in instructions_sheet.iter_rows(min_row=2, max_row=4, min_col=2, max_col=3):
         label = clean_text(label_cell.value).lower()
         state = STATE_ALIASES.get(label)
         if not state:
             continue
-        key = color_key(color_cell.fill.start_color)
+        fill = getattr(color_cell, "fill", None)
+        if fill is None:
+            # Read-only sheets yield fill-less placeholder cells for blanks.
+            continue
+        key = color_key(fill.start_color)
         if not key:
-            key = color_key(color_cell.fill.fgColor)
+            key = color_key(fill.fgColor)
         if key:
             COLOR_STATE_MAP[key] = state
     wb.close()
@@ -257,15 +332,25 @@ def color_key(color: Any) -> str:
     return ""
 
 
+def color_identity(color: Any) -> Tuple[Any, ...]:
+    """Raw attributes that ``color_key`` and ``classify_rgb`` read, usable as a cache key."""
+
+    if color is None:
+        return ()
+    return tuple(getattr(color, name, None) for name in _COLOR_ATTRIBUTES)
+
+
+@lru_cache(maxsize=1024)
 def classify_rgb(rgb: str) -> str:
     if not rgb:
         return "optional"
     hex_part = normalize_color_code(rgb)[-6:]
     if len(hex_part) != 6:
         return "optional"
-    r = int(hex_part[0:2], 16)
-    g = int(hex_part[2:4], 16)
-    b = int(hex_part[4:6], 16)
+    packed = int(hex_part, 16)
+    r = (packed >> 16) & 0xFF
+    g = (packed >> 8) & 0xFF
+    b = packed & 0xFF
     if g > r + 25 and g > b + 25:
         return "mandatory"
     if r >= g and r >= b:
@@ -280,10 +365,17 @@ def mandatory_state_from_color(cell: Optional[Cell]) -> str:
     if fill is None or fill.fill_type != "solid":
         if DEBUG.enabled:
             print(
-                f"[DEBUG] fill check: coord={cell.coordinate if cell else None} "
+                f"[DEBUG] fill check: coord={getattr(cell, 'coordinate', None)} "
                 f"fill_type={getattr(fill, 'fill_type', None)}"
             )
         return "optional"
+    cache_key = (
+        color_identity(fill.start_color),
+        color_identity(getattr(fill, "fgColor", None)),
+    )
+    cached = _FILL_STATE_CACHE.get(cache_key)
+    if cached is not None and not DEBUG.enabled:
+        return cached
     key = color_key(fill.start_color)
     if not key:
         key = color_key(getattr(fill, "fgColor", None))
@@ -291,11 +383,53 @@ def mandatory_state_from_color(cell: Optional[Cell]) -> str:
         print(
             f"[DEBUG] color key={key} coord={cell.coordinate} fill_type={fill.fill_type}"
         )
-    mapped = COLOR_STATE_MAP.get(key)
-    if mapped:
-        return mapped
-    rgb = normalize_color_code(getattr(fill.start_color, "rgb", None))
-    return classify_rgb(rgb)
+    state = COLOR_STATE_MAP.get(key)
+    if not state:
+        rgb = normalize_color_code(getattr(fill.start_color, "rgb", None))
+        state = classify_rgb(rgb)
+    _FILL_STATE_CACHE[cache_key] = state
+    return state
+
+
+def scan_worksheet(
+    worksheet: Worksheet,
+    field_column: Optional[int] = None,
+) -> Tuple[Dict[str, int], np.ndarray]:
+    """Collect field row numbers and cell colour states in a single streamed pass over the sheet.
+
+    Returns ``(row_lookup, fill_codes)``: the first Excel row of each cleaned, lower-cased value in
+    ``field_column``, and a ``uint8`` array of ``FILL_STATES`` codes indexed by 1-based
+    ``[row, column]``. Read it through ``fill_state_at``, which treats cells past its edge as optional.
+    """
+
+    row_lookup: Dict[str, int] = {}
+    rows: List[int] = []
+    columns: List[int] = []
+    codes: List[int] = []
+    for row_number, row in enumerate(worksheet.iter_rows(), start=1):
+        if field_column is not None and len(row) >= field_column:
+            key = clean_text(row[field_column - 1].value).lower()
+            if key and key not in row_lookup:
+                row_lookup[key] = row_number
+        for cell in row:
+            fill = getattr(cell, "fill", None)
+            if fill is not None and fill.fill_type == "solid":
+                code = _FILL_STATE_CODES[mandatory_state_from_color(cell)]
+                if code:
+                    rows.append(cell.row)
+                    columns.append(cell.column)
+                    codes.append(code)
+    if not codes:
+        return row_lookup, np.zeros((0, 0), dtype=np.uint8)
+    fill_codes = np.zeros((max(rows) + 1, max(columns) + 1), dtype=np.uint8)
+    fill_codes[rows, columns] = codes
+    return row_lookup, fill_codes
+
+
+def fill_state_at(fill_codes: np.ndarray, row: int, column: int) -> str:
+    if row < fill_codes.shape[0] and column < fill_codes.shape[1]:
+        return FILL_STATES[fill_codes[row, column]]
+    return "optional"
 
 
 def mandatory_state_from_text(value: Any) -> str:
@@ -304,9 +438,9 @@ def mandatory_state_from_text(value: Any) -> str:
         return ""
     if "optional" in text:
         return "optional"
-    if any(phrase in text for phrase in CONDITIONAL_PHRASES):
+    if CONDITIONAL_PHRASE_RE.search(text):
         return "conditional"
-    if any(phrase in text for phrase in MUST_MANDATORY_PHRASES):
+    if MUST_MANDATORY_PHRASE_RE.search(text):
         return "mandatory"
     if AFFIRMATIVE_TOKEN.match(text) or MANDATORY_TOKEN.search(text):
         return "mandatory"
@@ -315,6 +449,7 @@ def mandatory_state_from_text(value: Any) -> str:
     return ""
 
 
+@lru_cache(maxsize=4096)
 def parse_corridor_label(label: str) -> Tuple[str, str, str]:
     text = clean_text(label)
     descriptor = ""
@@ -354,6 +489,25 @@ def infer_channel(method: str, corridor_label: str, descriptor: str) -> str:
     return default_channel
 
 
+def channel_hint(key_lower: str) -> str:
+    """Channel implied by a cleaned, lower-cased sub-column header, or ``""`` for the corridor default."""
+
+    found = {match.lastgroup for match in CHANNEL_HINT_RE.finditer(key_lower.replace("-", " "))}
+    if "wire" in found:
+        return "wire"
+    if "local" in found:
+        return "local"
+    if "." in key_lower:
+        suffix = key_lower.split(".")[-1]
+        if suffix.isdigit() and int(suffix) % 2 == 1:
+            return "wire"
+    if "wire_key" in found:
+        return "wire"
+    if "local_key" in found:
+        return "local"
+    return ""
+
+
 def first_non_empty_column(df: pd.DataFrame) -> Optional[pd.Series]:
     for column in df.columns:
         series = df[column]
@@ -366,7 +520,8 @@ def first_non_empty_column(df: pd.DataFrame) -> Optional[pd.Series]:
 def annotate_mandatory_states(df: pd.DataFrame, worksheet: Optional[Worksheet]) -> pd.DataFrame:
     if df.empty:
         return df
-    result = df.copy()
+    # A shallow copy is enough under copy-on-write: only the columns assigned below get new data.
+    result = df.copy(deep=False)
     if "Mandatory" not in result.columns:
         result["Mandatory"] = ""
 
@@ -377,9 +532,14 @@ def annotate_mandatory_states(df: pd.DataFrame, worksheet: Optional[Worksheet])
         except ValueError:
             field_position = None
         if field_position is not None:
-            for offset, _ in enumerate(result.itertuples(index=False), start=2):
-                cell = worksheet.cell(row=offset, column=field_position)
-                color_states.append(mandatory_state_from_color(cell))
+            # One bulk pass down the field column (data rows start below the header row).
+            field_cells = worksheet.iter_rows(
+                min_row=2,
+                max_row=len(result) + 1,
+                min_col=field_position,
+                max_col=field_position,
+            )
+            color_states = [mandatory_state_from_color(cell) for (cell,) in field_cells]
     if not color_states:
         color_states = ["optional" for _ in range(len(result))]
     if len(color_states) != len(result):
@@ -388,17 +548,28 @@ def annotate_mandatory_states(df: pd.DataFrame, worksheet: Optional[Worksheet])
             fill_value[idx] = state
         color_states = fill_value
 
-    result["__mandatory_state__"] = color_states
-
-    textual_states = result["Mandatory"].apply(mandatory_state_from_text)
-    mask = result["__mandatory_state__"].isin(["optional", ""]) & textual_states.astype(bool)
-    result.loc[mask, "__mandatory_state__"] = textual_states[mask]
+    states = pd.Series(color_states, index=result.index)
+    textual_states = clean_series(result["Mandatory"]).map(mandatory_state_from_text)
+    states = states.mask(states.isin(["optional", ""]) & textual_states.astype(bool), textual_states)
 
-    result.loc[result["__mandatory_state__"] == "mandatory", "Mandatory"] = "mandatory"
-    result.loc[result["__mandatory_state__"] == "conditional", "Mandatory"] = "conditional"
+    result["__mandatory_state__"] = states
+    result["Mandatory"] = result["Mandatory"].mask(states.isin(["mandatory", "conditional"]), states)
     return result
 
 
+@dataclass(slots=True)
+class ChannelBucket:
+    """Requirement details gathered from one corridor's cells for a single channel."""
+
+    descriptions: List[str] = field(default_factory=list)
+    notes: List[str] = field(default_factory=list)
+    regex: str = ""
+    explicit_state: str = ""
+    explicit_note: str = ""
+    color_state: str = ""
+    non_empty_keys: List[str] = field(default_factory=list)
+
+
 def extract_matrix_records(
     sheet_name: str,
     sheet_df: pd.DataFrame,
@@ -418,31 +589,53 @@ def extract_matrix_records(
     field_series = first_non_empty_column(field_block)
     if field_series is None:
         return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
-    field_series = field_series.apply(clean_text)
+    field_series = clean_series(field_series)
 
     field_column_index = column_lookup.get(("Field name", field_block.columns[0]))
     row_lookup: Dict[str, int] = {}
-    if worksheet is not None and field_column_index is not None:
-        max_row = worksheet.max_row
-        for row_number in range(1, max_row + 1):
-            raw_value = worksheet.cell(row=row_number, column=field_column_index).value
-            key = clean_text(raw_value).lower()
-            if key and key not in row_lookup:
-                row_lookup[key] = row_number
+    fill_codes = np.zeros((0, 0), dtype=np.uint8)
+    if worksheet is not None:
+        row_lookup, fill_codes = scan_worksheet(worksheet, field_column_index)
 
     alias_series: Optional[pd.Series] = None
     if "N1 Fields Name" in base_columns:
         alias_block = sheet_df.xs("N1 Fields Name", axis=1, level=0)
         alias_candidate = first_non_empty_column(alias_block)
         if alias_candidate is not None:
-            alias_series = alias_candidate.apply(clean_text)
+            alias_series = clean_series(alias_candidate)
 
     corridor_names: List[str] = [
         name
         for name in sheet_df.columns.get_level_values(0).unique()
         if name not in {"Field name", "N1 Fields Name"}
     ]
-    records: List[Dict[str, Any]] = []
+    # Records are accumulated column-wise, one list per output column.
+    record_columns: List[List[str]] = [[] for _ in MATRIX_RECORD_COLUMNS]
+    if not corridor_names:
+        return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
+
+    field_values = field_series.to_numpy()
+    alias_values = alias_series.to_numpy() if alias_series is not None else None
+    field_rows = ((field_series != "") & (field_series.str.lower() != "notes")).to_numpy()
+
+    # Work on the cleaned corridor block as a plain 2-D array and address cells by position.
+    # ``np.nonzero`` walks it row-major (field row, corridor, sub-column), which is the order the
+    # channel buckets below rely on.
+    corridor_frame = sheet_df[corridor_names].apply(clean_series)
+    column_corridors = corridor_frame.columns.get_level_values(0).tolist()
+    column_keys = corridor_frame.columns.get_level_values(1).tolist()
+    # Sub-column headers are cleaned and lower-cased once per column, not once per cell.
+    column_key_texts = [clean_text(raw_key) for raw_key in column_keys]
+    column_key_lowers = [key_text.lower() for key_text in column_key_texts]
+    column_hints = [channel_hint(key_lower) for key_lower in column_key_lowers]
+    corridor_values = corridor_frame.to_numpy()
+    cell_rows, cell_columns = np.nonzero((corridor_values != "") & field_rows[:, np.newaxis])
+
+    # Corridor labels repeat on every field row; parse each one and pick its default channel once.
+    corridor_meta: Dict[str, Tuple[str, str, str]] = {}
+    for corridor in corridor_names:
+        country_name, currency_code, descriptor = parse_corridor_label(corridor)
+        corridor_meta[corridor] = (country_name, currency_code, infer_channel(method, corridor, descriptor))
 
     def derive_mandatory_and_conditional(texts: Sequence[str]) -> Tuple[str, str]:
         mandatory_value = ""
@@ -462,14 +655,21 @@ def extract_matrix_records(
                 mandatory_value = "mandatory"
         return mandatory_value, conditional_value
 
-    for row_position, (idx, field_name) in enumerate(field_series.items()):
-        normalized_field = clean_text(field_name)
-        if not normalized_field or normalized_field.lower() == "notes":
-            continue
+    # Bucket state depends on the order of a cell's siblings, so each (field row, corridor) group is
+    # folded in a single pass rather than through ``agg``.
+    # NOTE: keep this loop (and the per-cell loop inside it) bare; progress is reported per sheet by
+    # ingest(), and a tqdm wrapper here would pay its update cost on every populated cell.
+    groups = groupby(
+        zip(cell_rows.tolist(), cell_columns.tolist()),
+        key=lambda cell: (cell[0], column_corridors[cell[1]]),
+    )
+    for (row_position, corridor), group in groups:
+        group_cells = list(group)
+        normalized_field = field_values[row_position]
         row_lookup_key = normalized_field.lower()
         canonical_field = normalized_field
-        if alias_series is not None:
-            alias_value = clean_text(alias_series.get(idx, ""))
+        if alias_values is not None:
+            alias_value = alias_values[row_position]
             if alias_value and CODE_LIKE_RE.match(alias_value):
                 canonical_field = alias_value
 
@@ -478,223 +678,193 @@ def extract_matrix_records(
             header_offset = (max(MATRIX_HEADER_ROWS) + 2) if MATRIX_HEADER_ROWS else 1
             excel_row = row_position + header_offset
 
-        for corridor in corridor_names:
-            corridor_block = sheet_df.xs(corridor, axis=1, level=0)
-            if idx not in corridor_block.index:
-                continue
-            row_values = corridor_block.loc[idx]
-            if isinstance(row_values, pd.Series):
-                cleaned = {key: clean_text(value) for key, value in row_values.items()}
-            else:
-                cleaned = {corridor_block.columns: clean_text(row_values)}  # type: ignore[assignment]
-            non_empty_items = {key: value for key, value in cleaned.items() if value}
-            if not non_empty_items:
-                continue
+        country_name, currency_code, base_channel = corridor_meta[corridor]
 
-            country_name, currency_code, descriptor = parse_corridor_label(corridor)
-            base_channel = infer_channel(method, corridor, descriptor)
-
-            if DEBUG.enabled:
-                print(
-                    f"[DEBUG] non_empty_keys for {corridor}: {list(non_empty_items.keys())}"
-                )
+        if DEBUG.enabled:
+            print(
+                f"[DEBUG] non_empty_keys for {corridor}: {[column_keys[column] for _, column in group_cells]}"
+            )
 
-            channel_buckets: Dict[str, Dict[str, Any]] = {}
-
-            def resolve_channel(raw_key: str) -> str:
-                key = clean_text(raw_key)
-                key_lower = key.lower()
-                normalized = key_lower.replace("-", " ")
-                if any(hint in normalized for hint in WIRE_HINTS):
-                    return "wire"
-                if any(hint in normalized for hint in LOCAL_HINTS):
-                    return "local"
-                if "." in key_lower:
-                    suffix = key_lower.split(".")[-1]
-                    if suffix.isdigit() and int(suffix) % 2 == 1:
-                        return "wire"
-                if "regex(wires" in key_lower or "description.1" in key_lower or "description.3" in key_lower:
-                    return "wire"
-                if "regex(local" in key_lower:
-                    return "local"
-                return base_channel
-
-            for raw_key, value in non_empty_items.items():
-                channel = resolve_channel(raw_key)
-                bucket = channel_buckets.setdefault(
-                    channel,
-                    {
-                        "descriptions": [],
-                        "notes": [],
-                        "regex": "",
-                        "explicit_state": "",
-                        "explicit_note": "",
-                        "color_state": "",
-                        "non_empty_keys": [],
-                    },
-                )
-                bucket["non_empty_keys"].append(raw_key)
-
-                key_text = clean_text(raw_key)
-                lower_key = key_text.lower()
-                if "regex" in lower_key and "description" not in lower_key:
-                    if not bucket["regex"]:
-                        bucket["regex"] = value
-                    else:
-                        bucket["notes"].append(f"{key_text}: {value}")
-                elif "description" in lower_key:
-                    bucket["descriptions"].append(value)
+        channel_buckets: Dict[str, ChannelBucket] = {}
+
+        for _, column in group_cells:
+            raw_key = column_keys[column]
+            value = corridor_values[row_position, column]
+            channel = column_hints[column] or base_channel
+            bucket = channel_buckets.get(channel)
+            if bucket is None:
+                # Buckets are created on first use so records keep the sheet's channel order.
+                bucket = channel_buckets[channel] = ChannelBucket()
+            bucket.non_empty_keys.append(raw_key)
+
+            key_text = column_key_texts[column]
+            lower_key = column_key_lowers[column]
+            if "regex" in lower_key and "description" not in lower_key:
+                if not bucket.regex:
+                    bucket.regex = value
                 else:
-                    bucket["notes"].append(f"{key_text}: {value}")
-
-                if worksheet is not None and excel_row is not None:
-                    column_index = column_lookup.get((corridor, raw_key))
-                    if column_index is not None:
-                        cell = worksheet.cell(row=excel_row, column=column_index)
-                        color_state = mandatory_state_from_color(cell)
-                        if bucket["color_state"] != "mandatory" and color_state != "optional":
-                            bucket["color_state"] = color_state
-                        if color_state == "conditional" and bucket["explicit_state"] != "mandatory":
-                            bucket["explicit_state"] = "conditional"
-                            if not bucket["explicit_note"]:
-                                bucket["explicit_note"] = "Conditionally mandatory (highlighted)."
-
-                requirement_state = mandatory_state_from_text(value)
-                bucket_explicit = bucket.get("explicit_state")
-                if requirement_state != "mandatory" and bucket_explicit != "conditional":
-                    if "must" in clean_text(value).lower():
-                        requirement_state = "conditional"
-                if requirement_state == "conditional":
-                    bucket["explicit_state"] = "conditional"
-                    if not bucket["explicit_note"]:
-                        bucket["explicit_note"] = clean_text(value)
-                elif requirement_state == "mandatory" and bucket["explicit_state"] != "conditional":
-                    bucket["explicit_state"] = "mandatory"
-
-            # incorporate row-level color if present
-            row_color_state = ""
-            if (
-                worksheet is not None
-                and excel_row is not None
-                and field_column_index is not None
-            ):
-                row_color_state = mandatory_state_from_color(
-                    worksheet.cell(row=excel_row, column=field_column_index)
-                )
-
-            total_channels = len(channel_buckets)
-
-            for channel, bucket in channel_buckets.items():
-                color_state_detected = bucket["color_state"] or row_color_state
-                descriptions = bucket["descriptions"]
-                notes_list = bucket["notes"]
-                regex_value = bucket["regex"]
-                explicit_state = bucket["explicit_state"] or row_color_state
-                explicit_note = bucket["explicit_note"]
-
-                derived_mandatory, derived_conditional = derive_mandatory_and_conditional(
-                    descriptions + notes_list
-                )
-                if color_state_detected == "mandatory" and explicit_state != "mandatory":
-                    explicit_state = "mandatory"
-                if explicit_state == "conditional":
-                    mandatory_value = "conditional"
-                    conditional_value = explicit_note or derived_conditional
-                elif explicit_state == "mandatory":
+                    bucket.notes.append(f"{key_text}: {value}")
+            elif "description" in lower_key:
+                bucket.descriptions.append(value)
+            else:
+                bucket.notes.append(f"{key_text}: {value}")
+
+            if worksheet is not None and excel_row is not None:
+                column_index = column_lookup.get((corridor, raw_key))
+                if column_index is not None:
+                    color_state = fill_state_at(fill_codes, excel_row, column_index)
+                    if bucket.color_state != "mandatory" and color_state != "optional":
+                        bucket.color_state = color_state
+                    if color_state == "conditional" and bucket.explicit_state != "mandatory":
+                        bucket.explicit_state = "conditional"
+                        if not bucket.explicit_note:
+                            bucket.explicit_note = "Conditionally mandatory (highlighted)."
+
+            requirement_state = mandatory_state_from_text(value)
+            bucket_explicit = bucket.explicit_state
+            if requirement_state != "mandatory" and bucket_explicit != "conditional":
+                if "must" in clean_text(value).lower():
+                    requirement_state = "conditional"
+            if requirement_state == "conditional":
+                bucket.explicit_state = "conditional"
+                if not bucket.explicit_note:
+                    bucket.explicit_note = clean_text(value)
+            elif requirement_state == "mandatory" and bucket.explicit_state != "conditional":
+                bucket.explicit_state = "mandatory"
+
+        # incorporate row-level color if present
+        row_color_state = ""
+        if (
+            worksheet is not None
+            and excel_row is not None
+            and field_column_index is not None
+        ):
+            row_color_state = fill_state_at(fill_codes, excel_row, field_column_index)
+
+        total_channels = len(channel_buckets)
+
+        for channel, bucket in channel_buckets.items():
+            color_state_detected = bucket.color_state or row_color_state
+            descriptions = bucket.descriptions
+            notes_list = bucket.notes
+            regex_value = bucket.regex
+            explicit_state = bucket.explicit_state or row_color_state
+            explicit_note = bucket.explicit_note
+
+            derived_mandatory, derived_conditional = derive_mandatory_and_conditional(
+                descriptions + notes_list
+            )
+            if color_state_detected == "mandatory" and explicit_state != "mandatory":
+                explicit_state = "mandatory"
+            if explicit_state == "conditional":
+                mandatory_value = "conditional"
+                conditional_value = explicit_note or derived_conditional
+            elif explicit_state == "mandatory":
+                mandatory_value = "mandatory"
+                conditional_value = derived_conditional
+            elif color_state_detected in {"mandatory", "conditional"}:
+                if color_state_detected == "mandatory":
                     mandatory_value = "mandatory"
                     conditional_value = derived_conditional
-                elif color_state_detected in {"mandatory", "conditional"}:
-                    if color_state_detected == "mandatory":
-                        mandatory_value = "mandatory"
-                        conditional_value = derived_conditional
-                    elif color_state_detected == "conditional" and (
-                        channel != base_channel or derived_conditional or explicit_note
-                    ):
-                        mandatory_value = "conditional"
-                        conditional_value = explicit_note or derived_conditional
-                    else:
-                        mandatory_value = derived_mandatory
-                        conditional_value = derived_conditional
+                elif color_state_detected == "conditional" and (
+                    channel != base_channel or derived_conditional or explicit_note
+                ):
+                    mandatory_value = "conditional"
+                    conditional_value = explicit_note or derived_conditional
                 else:
                     mandatory_value = derived_mandatory
                     conditional_value = derived_conditional
+            else:
+                mandatory_value = derived_mandatory
+                conditional_value = derived_conditional
+
+            notes_parts = descriptions + notes_list
+            notes_text = " | ".join(part for part in notes_parts if part)
+
+            country = country_name.upper()
+            currency = currency_code.upper()
+            record_values = (
+                country,
+                currency,
+                canonical_field,
+                mandatory_value,
+                "",
+                "",
+                regex_value,
+                "",
+                conditional_value,
+                notes_text or sheet_name,
+                method,
+                channel,
+                mandatory_value or "optional",
+            )
+            for column_values, value in zip(record_columns, record_values):
+                column_values.append(value)
 
-                notes_parts = descriptions + notes_list
-                notes_text = " | ".join(part for part in notes_parts if part)
-
-                record = {
-                    "Country": country_name.upper(),
-                    "Currency": currency_code.upper(),
-                    "Field": canonical_field,
-                    "Mandatory": mandatory_value,
-                    "Data Type": "",
-                    "Length": "",
-                    "Regex": regex_value,
-                    "Allowed Values": "",
-                    "Conditional": conditional_value,
-                    "Notes": notes_text or sheet_name,
-                    "Method": method,
-                    "Channel": channel,
-                    "__mandatory_state__": mandatory_value or "optional",
-                }
-
-                if DEBUG.match(
-                    country=record["Country"],
-                    currency=record["Currency"],
-                    method=record["Method"],
-                    channel=record["Channel"],
-                ):
-                    print(
-                        f"[DEBUG] {record['Country']}/{record['Currency']} {record['Method']}:{record['Channel']} "
-                        f"field={record['Field']} mandatory={mandatory_value} conditional={conditional_value} "
-                        f"explicit_state={explicit_state} color_state={color_state_detected} "
-                        f"row_color={row_color_state} notes={notes_text}"
-                    )
-                if DEBUG.enabled and canonical_field == "remitter_postcode" and record["Channel"] == "local":
-                    print(
-                        f"[TRACE] remitter_postcode local -> explicit_state={explicit_state} "
-                        f"color_state={color_state_detected} derived=({derived_mandatory}, {derived_conditional})"
-                    )
-
-                records.append(record)
-
-    if not records:
+            if DEBUG.match(country=country, currency=currency, method=method, channel=channel):
+                print(
+                    f"[DEBUG] {country}/{currency} {method}:{channel} "
+                    f"field={canonical_field} mandatory={mandatory_value} conditional={conditional_value} "
+                    f"explicit_state={explicit_state} color_state={color_state_detected} "
+                    f"row_color={row_color_state} notes={notes_text}"
+                )
+            if DEBUG.enabled and canonical_field == "remitter_postcode" and channel == "local":
+                print(
+                    f"[TRACE] remitter_postcode local -> explicit_state={explicit_state} "
+                    f"color_state={color_state_detected} derived=({derived_mandatory}, {derived_conditional})"
+                )
+
+    if not record_columns[0]:
         return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
-    return pd.DataFrame.from_records(records)
+    records = pd.DataFrame(dict(zip(MATRIX_RECORD_COLUMNS, record_columns)))
+    # These columns only ever hold a handful of distinct values; store them as category codes.
+    return records.astype({column: "category" for column in CATEGORICAL_RECORD_COLUMNS})
+
+
+def read_matrix_sheet(workbook: pd.ExcelFile, sheet_name: str) -> Optional[pd.DataFrame]:
+    """The sheet with its two-row corridor header, or ``None`` when it is not a field matrix."""
+
+    try:
+        matrix_df = pd.read_excel(
+            workbook,
+            sheet_name=sheet_name,
+            header=MATRIX_HEADER_ROWS,
+            engine=workbook.engine,
+        )
+    except ValueError:
+        return None
+    if not isinstance(matrix_df.columns, pd.MultiIndex):
+        return None
+    if "Field name" not in set(matrix_df.columns.get_level_values(0)):
+        return None
+    return matrix_df
 
 
 def normalize_sheet(
     workbook: pd.ExcelFile,
     sheet_name: str,
-    base_df: pd.DataFrame,
     worksheet: Optional[Worksheet],
     method: str,
 ) -> pd.DataFrame:
-    if base_df.empty:
-        return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
-
-    if EXPECTED_COLUMNS.issubset(set(base_df.columns)):
-        working = annotate_mandatory_states(base_df.copy(), worksheet)
-    else:
-        try:
-            matrix_df = pd.read_excel(
-                workbook,
-                sheet_name=sheet_name,
-                header=[1, 2],
-                engine=workbook.engine,
-            )
-        except ValueError:
-            return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
+    # Method sheets are field matrices, so read the two-row header layout first; the flat layout is
+    # only parsed for sheets that turn out not to be one.
+    matrix_df = read_matrix_sheet(workbook, sheet_name)
+    if matrix_df is not None:
         return extract_matrix_records(sheet_name, matrix_df, method, worksheet)
 
+    base_df = pd.read_excel(workbook, sheet_name=sheet_name, engine=workbook.engine)
+    if base_df.empty or not EXPECTED_COLUMNS.issubset(set(base_df.columns)):
+        return pd.DataFrame(columns=EXPECTED_COLUMN_ORDER)
+    working = annotate_mandatory_states(base_df, worksheet)
+
     default_channel = DEFAULT_CHANNEL_BY_METHOD.get(method, "default")
     if "Method" not in working.columns:
         working["Method"] = method
-    working["Method"] = working["Method"].fillna(method).apply(lambda value: clean_text(value).lower() or method)
+    working["Method"] = clean_series(working["Method"].fillna(method)).str.lower().replace("", method)
 
     if "Channel" not in working.columns:
         working["Channel"] = default_channel
-    working["Channel"] = working["Channel"].apply(lambda value: clean_text(value).lower() or default_channel)
+    working["Channel"] = clean_series(working["Channel"]).str.lower().replace("", default_channel)
 
     if "__mandatory_state__" not in working.columns:
         working["__mandatory_state__"] = (
@@ -709,22 +879,43 @@ def normalize_sheet(
 
 
 def load_workbook(path: Path) -> pd.ExcelFile:
+    # Cell values come from calamine (a Rust reader, much faster than openpyxl's DOM parse);
+    # openpyxl is only opened separately for the fill colours.
+    try:
+        return pd.ExcelFile(path, engine="calamine")
+    except ImportError:
+        pass
     try:
         return pd.ExcelFile(path)
     except ValueError as exc:
         message = str(exc)
         if "could not read stylesheet" in message or "Max value is" in message:
-            try:
-                return pd.ExcelFile(path, engine="calamine")
-            except ImportError as calamine_exc:  # pragma: no cover - guardrail
-                raise RuntimeError(
-                    "Unable to read workbook because its styles are corrupted. "
-                    "Install the optional dependency `python-calamine` or provide a cleaned copy "
-                    "of the workbook."
-                ) from calamine_exc
+            raise RuntimeError(
+                "Unable to read workbook because its styles are corrupted. "
+                "Install the optional dependency `python-calamine` or provide a cleaned copy "
+                "of the workbook."
+            ) from exc
         raise
 
 
+DATA_TYPE_MAP = {
+    "string": "string",
+    "str": "string",
+    "text": "string",
+    "number": "number",
+    "float": "number",
+    "decimal": "number",
+    "integer": "integer",
+    "int": "integer",
+    "boolean": "boolean",
+    "bool": "boolean",
+    "array": "array",
+    "list": "array",
+    "object": "object",
+    "dict": "object",
+}
+
+
 def parse_length(value: Any) -> Tuple[int | None, int | None]:
     if value is None or (isinstance(value, float) and pd.isna(value)):
         return None, None
@@ -745,29 +936,58 @@ def parse_length(value: Any) -> Tuple[int | None, int | None]:
 
 
 def data_type_to_schema(data_type: Any) -> Dict[str, Any]:
-    mapping = {
-        "string": "string",
-        "str": "string",
-        "text": "string",
-        "number": "number",
-        "float": "number",
-        "decimal": "number",
-        "integer": "integer",
-        "int": "integer",
-        "boolean": "boolean",
-        "bool": "boolean",
-        "array": "array",
-        "list": "array",
-        "object": "object",
-        "dict": "object",
-    }
     if data_type is None or (isinstance(data_type, float) and pd.isna(data_type)):
         return {"type": "string"}
     normalized = str(data_type).strip().lower()
-    json_type = mapping.get(normalized, "string")
+    json_type = DATA_TYPE_MAP.get(normalized, "string")
     return {"type": json_type}
 
 
+def build_field_constraints(rows: pd.DataFrame) -> List[Dict[str, Any]]:
+    """Leaf schema (type, length limits, pattern, enum) for every row, in row order.
+
+    Data types and lengths only take a handful of distinct values across the workbook, so they are
+    mapped column-wise and each distinct length is parsed once. Rows with identical inputs share one
+    dict, which callers must treat as read-only.
+    """
+
+    def column(name: str) -> pd.Series:
+        if name in rows.columns:
+            return rows[name]
+        return pd.Series([None] * len(rows), index=rows.index, dtype=object)
+
+    json_types = column("Data Type").astype(str).str.strip().str.lower().map(DATA_TYPE_MAP).fillna("string")
+    lengths = column("Length").fillna("")
+    length_bounds = {value: parse_length(value) for value in lengths.unique()}
+
+    constraints: List[Dict[str, Any]] = []
+    rendered: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for inputs in zip(json_types, lengths, column("Regex"), column("Allowed Values")):
+        cached = rendered.get(inputs)
+        if cached is not None:
+            constraints.append(cached)
+            continue
+        json_type, length, regex, allowed = inputs
+        field_schema: Dict[str, Any] = {"type": json_type}
+        min_length, max_length = length_bounds[length]
+        if json_type == "string":
+            if min_length:
+                field_schema["minLength"] = min_length
+            if max_length:
+                field_schema["maxLength"] = max_length
+        if regex:
+            field_schema["pattern"] = str(regex).strip()
+        if allowed and not pd.isna(allowed):
+            raw_values = str(allowed).strip()
+            if raw_values:
+                choices = [value.strip() for value in raw_values.replace("|", ",").split(",") if value.strip()]
+                if choices:
+                    field_schema["enum"] = choices
+        rendered[inputs] = field_schema
+        constraints.append(field_schema)
+    return constraints
+
+
 def ensure_object_node(node: Dict[str, Any], key: str) -> Dict[str, Any]:
     properties = node.setdefault("properties", {})
     if key not in properties:
@@ -780,28 +1000,10 @@ def ensure_object_node(node: Dict[str, Any], key: str) -> Dict[str, Any]:
     return child
 
 
-def apply_field_schema(node: Dict[str, Any], field_parts: List[str], row: pd.Series) -> None:
-    cursor = node
-    for part in field_parts[:-1]:
-        cursor = ensure_object_node(cursor, part)
-    leaf_key = field_parts[-1]
-    cursor.setdefault("properties", {})
-    field_schema: Dict[str, Any] = data_type_to_schema(row.get("Data Type"))
-
-    min_length, max_length = parse_length(row.get("Length"))
-    if field_schema["type"] == "string":
-        if min_length:
-            field_schema["minLength"] = min_length
-        if max_length:
-            field_schema["maxLength"] = max_length
-    if row.get("Regex"):
-        field_schema["pattern"] = str(row["Regex"]).strip()
-    if row.get("Allowed Values") and not pd.isna(row.get("Allowed Values")):
-        raw_values = str(row["Allowed Values"]).strip()
-        if raw_values:
-            choices = [value.strip() for value in raw_values.replace("|", ",").split(",") if value.strip()]
-            if choices:
-                field_schema["enum"] = choices
+def render_leaf_schema(row: Mapping[str, Any], constraints: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+    """Leaf schema for one field row, plus its mandatory state."""
+
+    field_schema: Dict[str, Any] = dict(constraints)
 
     notes: List[str] = []
     if row.get("Conditional") and not pd.isna(row.get("Conditional")):
@@ -809,7 +1011,6 @@ def apply_field_schema(node: Dict[str, Any], field_parts: List[str], row: pd.Ser
     if row.get("Notes") and not pd.isna(row.get("Notes")):
         notes.append(str(row["Notes"]).strip())
 
-    cursor["properties"][leaf_key] = field_schema
     mandatory_state = str(row.get("__mandatory_state__", "")).strip().lower()
     if not mandatory_state:
         mandatory_state = mandatory_state_from_text(row.get("Mandatory"))
@@ -822,31 +1023,68 @@ def apply_field_schema(node: Dict[str, Any], field_parts: List[str], row: pd.Ser
             field_schema["description"] = f"{existing_description} | {combined_description}"
         else:
             field_schema["description"] = combined_description
+    return field_schema, mandatory_state
+
+
+def apply_field_schema(
+    node: Dict[str, Any],
+    field_parts: List[str],
+    leaf: Tuple[Dict[str, Any], str],
+) -> None:
+    cursor = node
+    for part in field_parts[:-1]:
+        cursor = ensure_object_node(cursor, part)
+    leaf_key = field_parts[-1]
+    field_schema, mandatory_state = leaf
+    # Copy: a later dotted path through this field turns it into an object node in place.
+    cursor.setdefault("properties", {})[leaf_key] = dict(field_schema)
     if mandatory_state == "mandatory":
         cursor.setdefault("required", [])
         if leaf_key not in cursor["required"]:
             cursor["required"].append(leaf_key)
 
 
+def channel_sort_key(item: Tuple[str, Any]) -> Tuple[int, str]:
+    return CHANNEL_ORDER.get(item[0], 50), item[0]
+
+
 def build_schemas(df: pd.DataFrame) -> Dict[Tuple[str, str], Dict[str, Any]]:
     corridors: Dict[Tuple[str, str], Dict[str, Dict[str, Dict[str, Any]]]] = defaultdict(lambda: defaultdict(dict))
 
-    for _, row in df.iterrows():
-        field_value = clean_text(row.get("Field", ""))
-        if not field_value:
-            continue
-        currency = clean_text(row.get("Currency", "")).upper()
-        country = clean_text(row.get("Country", "")).upper()
-        if not currency or not country:
+    constraints = build_field_constraints(df)
+
+    def text_column(name: str, default: str = "") -> pd.Series:
+        if name not in df.columns:
+            return pd.Series(default, index=df.index, dtype=object)
+        return clean_series(df[name].astype(object))
+
+    # Clean and normalise the routing columns in one vectorised pass; the loop below only assembles.
+    fields = text_column("Field")
+    currencies = text_column("Currency").str.upper()
+    countries = text_column("Country").str.upper()
+    methods = text_column("Method", "bank").str.lower().replace("", "bank")
+    channels = text_column("Channel").str.lower()
+    channels = channels.mask(channels == "", methods.map(DEFAULT_CHANNEL_BY_METHOD).fillna("default"))
+    channels = channels.mask((methods == "bank") & (channels == "default"), "local")
+
+    # Walk plain column arrays instead of iterrows(), which boxes every row into a Series.
+    detail_columns = [column for column in FIELD_DETAIL_COLUMNS if column in df.columns]
+    detail_values = [df[column].to_numpy() for column in detail_columns]
+    # The same dotted field recurs in every corridor; split each one once (apply_field_schema only reads it).
+    field_paths: Dict[str, List[str]] = {}
+    # Rows repeating the same constraints and details render the same leaf. Identical constraints share
+    # one dict (see build_field_constraints), and that list outlives the loop, so its id is a stable key.
+    leaf_cache: Dict[Tuple[Any, ...], Tuple[Dict[str, Any], str]] = {}
+    details_by_row = zip(*detail_values) if detail_values else repeat((), len(df))
+    rows = zip(fields, currencies, countries, methods, channels, details_by_row)
+    for position, (field_value, currency, country, method, channel, details) in enumerate(rows):
+        if not field_value or not currency or not country:
             continue
-        method = clean_text(row.get("Method", "bank")).lower() or "bank"
-        channel = clean_text(row.get("Channel", "")).lower()
-        if not channel:
-            channel = DEFAULT_CHANNEL_BY_METHOD.get(method, "default")
-        if method == "bank" and channel == "default":
-            channel = "local"
-
-        field_path = [part.strip() for part in field_value.split(".") if part.strip()]
+
+        field_path = field_paths.get(field_value)
+        if field_path is None:
+            field_path = [part.strip() for part in field_value.split(".") if part.strip()]
+            field_paths[field_value] = field_path
         if not field_path:
             continue
 
@@ -856,13 +1094,21 @@ def build_schemas(df: pd.DataFrame) -> Dict[Tuple[str, str], Dict[str, Any]]:
             channel,
             {"type": "object", "properties": {}, "required": [], "additionalProperties": True},
         )
-        apply_field_schema(channel_schema, field_path, row)
+        field_constraints = constraints[position]
+        leaf_key = (id(field_constraints), details)
+        leaf = leaf_cache.get(leaf_key)
+        if leaf is None:
+            leaf = render_leaf_schema(dict(zip(detail_columns, details)), field_constraints)
+            leaf_cache[leaf_key] = leaf
+        apply_field_schema(channel_schema, field_path, leaf)
 
     final: Dict[Tuple[str, str], Dict[str, Any]] = {}
     for (currency, country), method_map in corridors.items():
         payout_methods: Dict[str, Any] = {}
         for method, channels in method_map.items():
-            ordered_channels = dict(sorted(channels.items()))
+            ordered_channels = channels
+            if len(channels) > 1:
+                ordered_channels = dict(sorted(channels.items(), key=channel_sort_key))
             default_channel = DEFAULT_CHANNEL_BY_METHOD.get(method, next(iter(ordered_channels), "default"))
             if default_channel not in ordered_channels:
                 default_channel = next(iter(ordered_channels), "default")
@@ -880,12 +1126,49 @@ def build_schemas(df: pd.DataFrame) -> Dict[Tuple[str, str], Dict[str, Any]]:
     return final
 
 
-def write_schemas(schemas: Dict[Tuple[str, str], Dict[str, Any]], out_dir: Path) -> None:
+def write_schema(out_dir: Path, item: Tuple[Tuple[str, str], Dict[str, Any]]) -> None:
+    (currency, country), schema = item
+    write_json(out_dir / f"schema_{currency}_{country}.json", schema)
+
+
+def write_schema_bundle(schemas: Dict[Tuple[str, str], Dict[str, Any]], out_dir: Path) -> Path:
+    """Write every corridor schema, sorted by corridor, as one JSON Lines file.
+
+    Each line is ``{"currency", "country", "schema"}``. The file is zstd-compressed
+    (``schemas.jsonl.zst``) when ``zstandard`` is installed and plain ``schemas.jsonl`` otherwise.
+    """
+
+    lines = (
+        dumps_line({"currency": currency, "country": country, "schema": schemas[(currency, country)]}) + b"\n"
+        for currency, country in sorted(schemas)
+    )
+    if zstandard is None:
+        path = out_dir / "schemas.jsonl"
+        with path.open("wb") as handle:
+            handle.writelines(lines)
+        return path
+    path = out_dir / "schemas.jsonl.zst"
+    with path.open("wb") as handle, zstandard.ZstdCompressor().stream_writer(handle) as writer:
+        for line in lines:
+            writer.write(line)
+    return path
+
+
+def write_schemas(
+    schemas: Dict[Tuple[str, str], Dict[str, Any]],
+    out_dir: Path,
+    *,
+    bundle: bool = False,
+) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
-    for (currency, country), schema in tqdm(schemas.items(), desc="Writing schemas"):
-        schema_path = out_dir / f"schema_{currency}_{country}.json"
-        with schema_path.open("w", encoding="utf-8") as handle:
-            json.dump(schema, handle, indent=2, ensure_ascii=True)
+    if bundle:
+        write_schema_bundle(schemas, out_dir)
+        return
+    # One file per corridor; threads overlap the open/write/close syscalls of independent files.
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        writes = executor.map(partial(write_schema, out_dir), schemas.items())
+        list(tqdm(writes, total=len(schemas), desc="Writing schemas"))
 
 
 def validate_columns(df: pd.DataFrame) -> None:
@@ -894,51 +1177,158 @@ def validate_columns(df: pd.DataFrame) -> None:
         raise ValueError(f"Workbook is missing expected columns: {sorted(missing)}")
 
 
-def ingest(workbook_path: Path) -> None:
-    if not workbook_path.exists():
-        raise FileNotFoundError(f"Workbook not found: {workbook_path}")
+def unify_categories(frames: List[pd.DataFrame]) -> List[pd.DataFrame]:
+    """Cast the categorical record columns of every frame to one shared dtype.
 
-    build_color_state_map(workbook_path)
-    excel_workbook = load_workbook(workbook_path)
-    color_workbook = None
+    ``concat`` only keeps a categorical column when all inputs carry identical categories; otherwise
+    it silently decodes every row back to an object array.
+    """
+
+    dtypes: Dict[str, pd.CategoricalDtype] = {}
+    for column in CATEGORICAL_RECORD_COLUMNS:
+        values: set = set()
+        for frame in frames:
+            if column in frame.columns:
+                values.update(frame[column].dropna().unique())
+        dtypes[column] = pd.CategoricalDtype(sorted(values, key=str))
+    return [
+        frame.astype({column: dtype for column, dtype in dtypes.items() if column in frame.columns})
+        for frame in frames
+    ]
+
+
+def select_debug_rows(df: pd.DataFrame, debug_filter: Mapping[str, str]) -> pd.DataFrame:
+    """Rows of the merged frame belonging to the debugged corridor.
+
+    Method and channel filters are not applied: the corridor's schema file is still written, and it
+    has to stay complete rather than hold only the debugged method.
+    """
+
+    mask = pd.Series(True, index=df.index)
+    for column in ("Country", "Currency"):
+        if column in debug_filter and column in df.columns:
+            mask &= clean_series(df[column].astype(object)).str.upper() == debug_filter[column]
+    return df[mask]
+
+
+def open_color_workbook(workbook_path: Path) -> Optional[Workbook]:
     try:
-        color_workbook = openpyxl_load_workbook(workbook_path, data_only=True)
+        # Streamed, read-only access is all the colour pass needs (iter_rows and cell fills), and it
+        # avoids materialising every cell of every sheet up front.
+        return openpyxl_load_workbook(workbook_path, data_only=True, read_only=True, keep_links=False)
     except ValueError as exc:
         message = str(exc)
         if "could not read stylesheet" not in message and "Max value is" not in message:
             raise
     except Exception:
-        color_workbook = None
-    combined_frames: List[pd.DataFrame] = []
+        pass
+    return None
 
-    for sheet_name in excel_workbook.sheet_names:
-        method = infer_method(sheet_name)
-        if method is None:
-            continue
-        sheet_df = pd.read_excel(excel_workbook, sheet_name=sheet_name, engine=excel_workbook.engine)
-        worksheet = None
-        if color_workbook is not None and sheet_name in color_workbook.sheetnames:
-            worksheet = color_workbook[sheet_name]
-        normalized = normalize_sheet(excel_workbook, sheet_name, sheet_df, worksheet, method)
-        if normalized.empty:
-            continue
-        validate_columns(normalized)
-        normalized["Notes"] = normalized["Notes"].where(normalized["Notes"].astype(bool), sheet_name)
-        combined_frames.append(normalized)
 
-    if not combined_frames:
+def load_sheet(
+    excel_workbook: pd.ExcelFile,
+    color_workbook: Optional[Workbook],
+    sheet_name: str,
+    method: str,
+) -> pd.DataFrame:
+    worksheet = None
+    if color_workbook is not None and sheet_name in color_workbook.sheetnames:
+        worksheet = color_workbook[sheet_name]
+    normalized = normalize_sheet(excel_workbook, sheet_name, worksheet, method)
+    if normalized.empty:
+        return normalized
+    notes = normalized["Notes"]
+    if isinstance(notes.dtype, pd.StringDtype):
+        # In a text column only "" is falsy (missing values are truthy and stay as they are), so an
+        # equality mask replaces the boolean cast.
+        blank = notes.eq("")
+    else:
+        blank = ~notes.astype(bool)
+    if blank.any():
+        normalized["Notes"] = notes.mask(blank, sheet_name)
+    return normalized
+
+
+def normalize_sheet_task(task: Tuple[Path, str, str, Dict[str, str]]) -> pd.DataFrame:
+    """Process-pool entry point: re-open the workbook in the worker and normalise one sheet.
+
+    The colour legend is passed in rather than rebuilt so workers skip the instructions sheet.
+    """
+
+    workbook_path, sheet_name, method, color_state_map = task
+    COLOR_STATE_MAP.clear()
+    COLOR_STATE_MAP.update(color_state_map)
+    _FILL_STATE_CACHE.clear()
+    excel_workbook = load_workbook(workbook_path)
+    color_workbook = open_color_workbook(workbook_path)
+    try:
+        return load_sheet(excel_workbook, color_workbook, sheet_name, method)
+    finally:
         if color_workbook is not None:
             color_workbook.close()
         excel_workbook.close()
+
+
+def ingest(workbook_path: Path, *, workers: Optional[int] = None, bundle: bool = False) -> None:
+    if not workbook_path.exists():
+        raise FileNotFoundError(f"Workbook not found: {workbook_path}")
+
+    build_color_state_map(workbook_path)
+    excel_workbook = load_workbook(workbook_path)
+    sheet_methods: List[Tuple[str, str]] = []
+    for sheet_name in excel_workbook.sheet_names:
+        method = infer_method(sheet_name)
+        if method is not None:
+            sheet_methods.append((sheet_name, method))
+
+    # Sheets are independent, so each one can be normalised in its own process. Every worker has to
+    # parse the workbook's styles again, so a single worker (or a debug run, whose traces would
+    # interleave) stays in-process and shares one openpyxl load.
+    max_workers = min(workers or os.cpu_count() or 1, len(sheet_methods))
+    if max_workers > 1 and not DEBUG.enabled:
+        excel_workbook.close()
+        tasks = [
+            (workbook_path, sheet_name, method, dict(COLOR_STATE_MAP))
+            for sheet_name, method in sheet_methods
+        ]
+        frames: List[pd.DataFrame] = [pd.DataFrame()] * len(tasks)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {executor.submit(normalize_sheet_task, task): position for position, task in enumerate(tasks)}
+            # Collect sheets as they finish, but keep workbook order: later rows override earlier ones
+            # in build_schemas.
+            for future in tqdm(as_completed(futures), total=len(futures), desc="Normalising sheets"):
+                frames[futures[future]] = future.result()
+    else:
+        color_workbook = open_color_workbook(workbook_path)
+        try:
+            frames = [
+                load_sheet(excel_workbook, color_workbook, sheet_name, method)
+                for sheet_name, method in tqdm(sheet_methods, desc="Normalising sheets")
+            ]
+        finally:
+            if color_workbook is not None:
+                color_workbook.close()
+            excel_workbook.close()
+
+    combined_frames = [frame for frame in frames if not frame.empty]
+    if not combined_frames:
         raise ValueError("Workbook did not contain any data rows.")
 
-    merged = pd.concat(combined_frames, ignore_index=True)
-    if color_workbook is not None:
-        color_workbook.close()
-    excel_workbook.close()
+    merged = pd.concat(unify_categories(combined_frames), ignore_index=True)
+    # normalize_sheet emits every expected column (flat sheets without them are skipped), so one
+    # check on the merged frame covers all sheets.
+    validate_columns(merged)
+    debug_filter = DEBUG.as_filter()
+    if debug_filter and not bundle:
+        # A debug run only needs the targeted corridor built and written. A bundle is rewritten as a
+        # whole, so it always gets every corridor.
+        merged = select_debug_rows(merged, debug_filter)
     schemas = build_schemas(merged)
-    write_schemas(schemas, settings.SCHEMA_DIR)
-    print(f"Generated {len(schemas)} corridor schema files in {settings.SCHEMA_DIR}.")
+    write_schemas(schemas, settings.SCHEMA_DIR, bundle=bundle)
+    if bundle:
+        print(f"Bundled {len(schemas)} corridor schemas in {settings.SCHEMA_DIR}.")
+    else:
+        print(f"Generated {len(schemas)} corridor schema files in {settings.SCHEMA_DIR}.")
 
 
 def main(args: Iterable[str] | None = None) -> None:
@@ -953,6 +1343,17 @@ def main(args: Iterable[str] | None = None) -> None:
     parser.add_argument("--debug-currency", type=str, default=None, help="Debug currency code (e.g. AUD).")
     parser.add_argument("--debug-method", type=str, default=None, help="Debug payout method (bank, wallet, ...).")
     parser.add_argument("--debug-channel", type=str, default=None, help="Debug channel (local, wire, ...).")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Processes used to normalise sheets (defaults to the CPU count; 1 runs in-process).",
+    )
+    parser.add_argument(
+        "--bundle",
+        action="store_true",
+        help="Write one schemas.jsonl(.zst) bundle instead of a file per corridor.",
+    )
     parsed = parser.parse_args(args=args)
     DEBUG.configure(
         country=parsed.debug_country,
@@ -960,7 +1361,7 @@ def main(args: Iterable[str] | None = None) -> None:
         method=parsed.debug_method,
         channel=parsed.debug_channel,
     )
-    ingest(parsed.workbook)
+    ingest(parsed.workbook, workers=parsed.workers, bundle=parsed.bundle)
 
 
 if __name__ == "__main__":
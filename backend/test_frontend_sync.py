@@ -12,18 +12,30 @@ import os
 import re
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
+from pathlib import Path
 import httpx
 import pandas as pd
 
-@dataclass
+from app.jsonio import write_json
+
+RESULTS_PATH = Path("frontend_sync_results.json")
+
+_WORD_CLEAN_RE = re.compile(r'[^\w\s]')
+_FIELD_RE = re.compile(r'\b\w+(?:Number|Code|Name|Address|Id|Type|Amount|Currency|Purpose)\b', re.IGNORECASE)
+_UPPER_CODE_RE = re.compile(r'\b[A-Z]{2,}\b')
+_REGEX_PATTERN_RE = re.compile(r'\^\[.*\]\$|\^\d+\$')
+_STOPWORDS = frozenset({'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must'})
+
+@dataclass(slots=True, frozen=True)
 class TestCase:
     question: str
     expected_response: str
     category: str
     priority: str
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TestResult:
     question: str
     expected: str
@@ -41,15 +53,20 @@ class ResponseMatcher:
     def extract_keywords(text: str) -> set[str]:
         """Extract meaningful keywords from text"""
         # Remove common words and extract meaningful terms
-        cleaned = re.sub(r'[^\w\s]', ' ', text.lower())
+        cleaned = _WORD_CLEAN_RE.sub(' ', text.lower())
         words = cleaned.split()
-        stopwords = {'a', 'an', 'the', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'could', 'should', 'may', 'might', 'must'}
-        return {w for w in words if len(w) > 2 and w not in stopwords}
+        return {w for w in words if len(w) > 2 and w not in _STOPWORDS}
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def expected_keywords(expected: str) -> frozenset[str]:
+        """Keywords of an expected response, extracted once per distinct text"""
+        return frozenset(ResponseMatcher.extract_keywords(expected))
     
     @staticmethod
     def check_mandatory_fields_match(expected: str, actual: str) -> tuple[bool, List[str]]:
         """Check if mandatory fields are covered in the response"""
-        expected_fields = re.findall(r'\b\w+(?:Number|Code|Name|Address|Id|Type|Amount|Currency|Purpose)\b', expected, re.IGNORECASE)
+        expected_fields = _FIELD_RE.findall(expected)
         issues = []
         
         for field in expected_fields:
@@ -68,7 +85,7 @@ class ResponseMatcher:
     @staticmethod
     def check_proxy_values_match(expected: str, actual: str) -> tuple[bool, List[str]]:
         """Check if proxy values are properly covered"""
-        expected_types = re.findall(r'\b[A-Z]{2,}\b', expected)
+        expected_types = _UPPER_CODE_RE.findall(expected)
         issues = []
         
         for proxy_type in expected_types:
@@ -103,7 +120,7 @@ class ResponseMatcher:
         issues = []
         
         # Look for regex patterns
-        regex_patterns = re.findall(r'\^\[.*\]\$|\^\d+\$', expected)
+        regex_patterns = _REGEX_PATTERN_RE.findall(expected)
         for pattern in regex_patterns:
             if pattern not in actual:
                 issues.append(f"Missing regex pattern: {pattern}")
@@ -127,80 +144,106 @@ class ResponseMatcher:
             return cls.check_validation_rules_match(expected, actual)
         else:
             # Generic keyword matching for other categories
-            expected_keywords = cls.extract_keywords(expected)
-            actual_keywords = cls.extract_keywords(actual)
+            expected_keywords = cls.expected_keywords(expected)
+            if not expected_keywords:
+                return True, []
+            required = len(expected_keywords) * 0.5  # Pass unless more than 50% are missing
+            covered = set()
             
-            missing_keywords = expected_keywords - actual_keywords
-            if len(missing_keywords) > len(expected_keywords) * 0.5:  # More than 50% missing
-                return False, [f"Missing key concepts: {', '.join(missing_keywords)}"]
+            # Single pass over the response, stopping as soon as enough concepts are covered
+            for word in _WORD_CLEAN_RE.sub(' ', actual.lower()).split():
+                if word in expected_keywords and word not in covered:
+                    covered.add(word)
+                    if len(covered) >= required:
+                        return True, []
             
-            return True, []
+            missing_keywords = expected_keywords - covered
+            return False, [f"Missing key concepts: {', '.join(missing_keywords)}"]
 
 class FrontendSyncTester:
-    def __init__(self, frontend_url: str = "http://localhost:5000"):
+    def __init__(self, frontend_url: str = "http://localhost:5000", concurrency: int = 8):
         self.frontend_url = frontend_url
         self.api_proxy_url = f"{frontend_url}/api-proxy"
+        self.concurrency = concurrency
+        self._client: Optional[httpx.AsyncClient] = None
         
-    async def create_conversation(self) -> str:
-        """Create a new conversation and return the ID"""
-        async with httpx.AsyncClient(verify=False) as client:
-            response = await client.post(
-                f"{self.api_proxy_url}/conversations",
+    async def start(self) -> None:
+        """Open the HTTP client shared by every request so connections are kept alive"""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                verify=False,
                 headers={
                     "Content-Type": "application/json",
                     "X-Client-Id": "test-sync-checker"
-                },
-                json={"title": "Frontend Sync Test"}
+                }
             )
-            if response.status_code == 200:
-                return response.json()["id"]
-            else:
-                raise Exception(f"Failed to create conversation: {response.status_code}")
+    
+    async def close(self) -> None:
+        """Close the shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            raise RuntimeError("FrontendSyncTester.start() must be awaited before sending requests")
+        return self._client
+        
+    async def create_conversation(self) -> str:
+        """Create a new conversation and return the ID"""
+        response = await self.client.post(
+            f"{self.api_proxy_url}/conversations",
+            json={"title": "Frontend Sync Test"}
+        )
+        if response.status_code == 200:
+            return response.json()["id"]
+        else:
+            raise Exception(f"Failed to create conversation: {response.status_code}")
     
     async def send_message(self, conversation_id: str, message: str) -> tuple[str, int]:
         """Send message through frontend and return response + time taken"""
         start_time = time.time()
         
-        async with httpx.AsyncClient(timeout=30.0, verify=False) as client:
-            response = await client.post(
-                f"{self.api_proxy_url}/conversations/{conversation_id}/messages",
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Client-Id": "test-sync-checker"
-                },
-                json={"content": message}
-            )
-            
-            end_time = time.time()
-            response_time_ms = int((end_time - start_time) * 1000)
-            
-            if response.status_code == 200:
-                data = response.json()
-                # Handle frontend response structure: {user_message: {...}, assistant_message: {content: "..."}}
-                if "assistant_message" in data and "content" in data["assistant_message"]:
-                    return data["assistant_message"]["content"], response_time_ms
-                else:
-                    return f"ERROR: Unexpected response structure: {data}", response_time_ms
+        response = await self.client.post(
+            f"{self.api_proxy_url}/conversations/{conversation_id}/messages",
+            json={"content": message}
+        )
+        
+        end_time = time.time()
+        response_time_ms = int((end_time - start_time) * 1000)
+        
+        if response.status_code == 200:
+            data = response.json()
+            # Handle frontend response structure: {user_message: {...}, assistant_message: {content: "..."}}
+            if "assistant_message" in data and "content" in data["assistant_message"]:
+                return data["assistant_message"]["content"], response_time_ms
             else:
-                return f"ERROR: {response.status_code} - {response.text}", response_time_ms
+                return f"ERROR: Unexpected response structure: {data}", response_time_ms
+        else:
+            return f"ERROR: {response.status_code} - {response.text}", response_time_ms
     
     def load_test_cases(self, csv_path: str) -> List[TestCase]:
         """Load test cases from CSV file"""
-        test_cases = []
-        with open(csv_path, 'r', encoding='utf-8') as file:
-            reader = csv.DictReader(file)
-            for row in reader:
-                test_cases.append(TestCase(
-                    question=row['question'].strip('"'),
-                    expected_response=row['expected_response'],
-                    category=row['category'],
-                    priority=row['priority']
-                ))
-        return test_cases
+        columns = ['question', 'expected_response', 'category', 'priority']
+        # Read every column as text and keep blank cells as "" (not NaN), matching csv.DictReader
+        df = pd.read_csv(
+            csv_path,
+            encoding='utf-8',
+            usecols=columns,
+            dtype=str,
+            keep_default_na=False,
+            quoting=csv.QUOTE_MINIMAL
+        )[columns]
+        df['question'] = df['question'].str.strip('"')
+        return [TestCase(*row) for row in df.itertuples(index=False, name=None)]
     
-    async def run_test_case(self, test_case: TestCase, conversation_id: str) -> TestResult:
-        """Run a single test case and return result"""
+    async def run_test_case(self, test_case: TestCase, conversation_id: Optional[str] = None) -> TestResult:
+        """Run a single test case (in a fresh conversation unless one is given) and return result"""
         try:
+            if conversation_id is None:
+                conversation_id = await self.create_conversation()
             actual_response, response_time = await self.send_message(conversation_id, test_case.question)
             passed, issues = ResponseMatcher.match_response(test_case, actual_response)
             
@@ -232,20 +275,25 @@ class FrontendSyncTester:
         test_cases = self.load_test_cases(csv_path)
         print(f"Loaded {len(test_cases)} test cases")
         
-        print("Creating conversation...")
-        conversation_id = await self.create_conversation()
-        
         print("Running tests...")
-        results = []
-        failed_results = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        completed = 0
+        passed_tests = 0
+        failures: List[tuple[int, Dict[str, Any]]] = []
         
-        for i, test_case in enumerate(test_cases, 1):
-            print(f"Running test {i}/{len(test_cases)}: {test_case.category}")
-            result = await self.run_test_case(test_case, conversation_id)
-            results.append(result)
-            
-            if not result.passed:
-                failed_results.append({
+        async def run_limited(position: int, test_case: TestCase) -> None:
+            nonlocal completed, passed_tests
+            # Bound the in-flight requests instead of pausing between them. Each test gets its own
+            # conversation so concurrent tests never see each other's messages in their context.
+            async with semaphore:
+                result = await self.run_test_case(test_case)
+            completed += 1
+            print(f"Finished test {completed}/{len(test_cases)}: {test_case.category}")
+            # Classify straight away; only failures keep their response text
+            if result.passed:
+                passed_tests += 1
+            else:
+                failures.append((position, {
                     "question": result.question,
                     "expected_response": result.expected,
                     "actual_response": result.actual,
@@ -253,14 +301,14 @@ class FrontendSyncTester:
                     "priority": result.priority,
                     "issues": result.issues,
                     "response_time_ms": result.response_time_ms
-                })
-            
-            # Small delay to avoid overwhelming the system
-            await asyncio.sleep(0.5)
+                }))
+        
+        await asyncio.gather(*(run_limited(position, test_case) for position, test_case in enumerate(test_cases)))
+        failures.sort(key=lambda failure: failure[0])
+        failed_results = [failure for _, failure in failures]
         
         # Calculate summary stats
-        total_tests = len(results)
-        passed_tests = sum(1 for r in results if r.passed)
+        total_tests = len(test_cases)
         failed_tests = total_tests - passed_tests
         
         return {
@@ -276,13 +324,19 @@ class FrontendSyncTester:
 
 async def main():
     tester = FrontendSyncTester()
-    results = await tester.run_all_tests("../attached_assets/test_cases_1759132102565.csv")
+    await tester.start()
+    try:
+        results = await tester.run_all_tests("../attached_assets/test_cases_1759132102565.csv")
+    finally:
+        await tester.close()
     
-    # Output JSON results
+    # Write the full JSON results to disk; only the summary goes to stdout
+    write_json(RESULTS_PATH, results)
     print("\n" + "="*80)
     print("FRONTEND-BACKEND SYNC TEST RESULTS")
     print("="*80)
-    print(json.dumps(results, indent=2))
+    print(json.dumps(results["summary"], indent=2))
+    print(f"Full results written to {RESULTS_PATH}")
 
 if __name__ == "__main__":
     asyncio.run(main())
\ No newline at end of file
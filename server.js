@@ -39,7 +39,7 @@ async function waitForBackend() {
 
 async function startBackend() {
   console.log('Starting FastAPI backend...');
-  backendProcess = spawn('python', ['main_simple.py'], {
+  backendProcess = spawn('python', ['main.py'], {
     cwd: './backend',
     stdio: 'inherit',
     env: { ...process.env }